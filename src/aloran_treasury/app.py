@@ -43,6 +43,7 @@ from .wallet import (
     LAMPORTS_PER_SOL,
     NETWORKS,
     AssociatedTokenAccount,
+    EndpointStatus,
     TokenProgram,
     TransactionHistoryEntry,
     TransferRequest,
@@ -322,11 +323,11 @@ class TreasuryConsole(QWidget):
         label = QLabel("Network Mode")
         label.setObjectName("muted")
         combo = QComboBox()
-        combo.addItems(NETWORKS)
-        combo.setCurrentText(self.wallet_state.network)
+        combo.addItems([network.label for network in NETWORKS])
+        combo.setCurrentText(self.wallet_state.network.label)
         combo.currentTextChanged.connect(self._handle_network_changed)
 
-        chip = QLabel(self._network_chip_text())
+        chip = QLabel(self._network_chip_text(self.wallet_state.current_endpoint_status()))
         chip.setObjectName("networkChip")
         self.network_chip = chip
 
@@ -624,10 +625,9 @@ class TreasuryConsole(QWidget):
         column.addWidget(retry_button)
         return column
 
-    def _network_chip_text(self) -> str:
-        status = self.wallet_state.current_endpoint_status()
+    def _network_chip_text(self, status: EndpointStatus) -> str:
         latency = (
-            f"{status.last_latency_ms:.0f} ms" if status.last_latency_ms is not None else "—"
+            f"{status.latency_ms:.0f} ms" if status.latency_ms is not None else "—"
         )
         if status.last_checked is None:
             state = "Checking…"
@@ -637,8 +637,7 @@ class TreasuryConsole(QWidget):
             state = "Unhealthy"
         return f"{self.wallet_state.network} · {status.label} ({latency}) · {state}"
 
-    def _network_chip_style(self) -> str:
-        status = self.wallet_state.current_endpoint_status()
+    def _network_chip_style(self, status: EndpointStatus) -> str:
         if status.last_checked is None:
             background = PALETTE["medium_blue"]
         elif status.healthy:
@@ -653,8 +652,9 @@ class TreasuryConsole(QWidget):
     def _update_network_chip(self) -> None:
         if not hasattr(self, "network_chip"):
             return
-        self.network_chip.setText(self._network_chip_text())
-        self.network_chip.setStyleSheet(self._network_chip_style())
+        status = self.wallet_state.current_endpoint_status()
+        self.network_chip.setText(self._network_chip_text(status))
+        self.network_chip.setStyleSheet(self._network_chip_style(status))
 
     def _public_key_line(self) -> str:
         if self.wallet_state.locked:
@@ -682,7 +682,7 @@ class TreasuryConsole(QWidget):
         return f"Active mint: {mint}" if mint else "Active mint: none selected"
 
     def _signature_url(self, signature: str) -> str:
-        cluster = self.wallet_state.network.lower()
+        cluster = self.wallet_state.network.label.lower()
         cluster_param = "" if cluster == "mainnet" else f"?cluster={cluster}"
         return f"https://explorer.solana.com/tx/{signature}{cluster_param}"
 
@@ -748,12 +748,15 @@ class TreasuryConsole(QWidget):
         self.lock_button.setText("Lock" if not locked else "Locked")
         self.lock_button.setEnabled(not locked)
 
-        for button in getattr(self, "action_buttons", []):
+        buttons = getattr(self, "action_buttons", [])
+        for button in buttons:
             button.setEnabled(not locked)
             if locked:
                 button.setToolTip("Unlock the wallet to sign or broadcast actions.")
             else:
                 button.setToolTip("")
+        # Read back from the widgets so a button that failed to toggle shows up here.
+        self._action_enabled = tuple(button.isEnabled() for button in buttons)
 
         if hasattr(self, "mint_panel") and isinstance(self.mint_panel, MintSettingsPanel):
             self.mint_panel.set_locked(locked)
@@ -933,10 +936,7 @@ class TreasuryConsole(QWidget):
             return
 
         address = self.ata_table.item(row, 1).text()
-        account = next(
-            (ata for ata in self.wallet_controller.list_associated_accounts() if ata.address == address),
-            None,
-        )
+        account = self.wallet_state.associated_account(address)
         if account is None:
             self._show_error("Not found", "The selected ATA is no longer tracked.")
             return
@@ -1070,6 +1070,7 @@ class TreasuryConsole(QWidget):
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802 - Qt override
         if hasattr(self, "network_monitor"):
             self.network_monitor.stop()
+        self.wallet_controller.close()
         super().closeEvent(event)
 
     def _handle_network_changed(self, network: str) -> None:
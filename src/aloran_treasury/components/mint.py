@@ -21,7 +21,7 @@ from PySide6.QtWidgets import (
 )
 from solders.pubkey import Pubkey
 
-from ..wallet import MintInfo, WalletController, WalletState
+from ..wallet import MintInfo, WalletController, WalletState, is_base58_pubkey
 
 
 @dataclass
@@ -56,6 +56,9 @@ class MintFormState:
 def validate_pubkey(value: str) -> bool:
     """Return True when the provided string is a valid base58 pubkey."""
 
+    # Reject obvious non-keys by length and alphabet before the full decode.
+    if not is_base58_pubkey(value):
+        return False
     try:
         Pubkey.from_string(value)
         return True
@@ -368,8 +371,8 @@ class MintSettingsPanel(QFrame):
             self._emit_activity(f"Validation failed: {exc}")
             return
 
-        payload = self.wallet_controller.build_mint_payload(state)
-        payload["mode"] = mode
+        # The controller may hand back a cached payload; don't mutate it.
+        payload = {**self.wallet_controller.build_mint_payload(state), "mode": mode}
         if self.on_payload_ready:
             self.on_payload_ready(payload)
         self._emit_activity(f"Mint {mode} payload prepared.")
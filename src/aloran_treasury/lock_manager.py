@@ -8,9 +8,10 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from solders.keypair import Keypair
+if TYPE_CHECKING:
+    from solders.keypair import Keypair
 
 
 def _xor_bytes(left: bytes, right: bytes) -> bytes:
@@ -94,6 +95,8 @@ class LockManager:
     def persist_keystore(self, passphrase: str, keypair: Keypair) -> None:
         """Persist the provided keypair encrypted with the given passphrase."""
 
+        from solders.keypair import Keypair
+
         salt = Keypair().to_bytes()[:16]
         derived_key = _derive_key(passphrase, salt)
         ciphertext = _xor_bytes(keypair.to_bytes(), derived_key)
@@ -110,6 +113,8 @@ class LockManager:
     def unlock(self, passphrase: str) -> Keypair:
         """Decrypt the keystore and hydrate the in-memory keypair."""
 
+        from solders.keypair import Keypair
+
         if self._keystore_metadata is None:
             raise RuntimeError("No keystore metadata available")
 
@@ -2,17 +2,61 @@
 
 from __future__ import annotations
 
+import statistics
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
 from typing import Optional
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject, QTimer, Signal
 from solana.rpc.api import Client
 
-from .wallet import WalletState
+from .wallet import Network, WalletState
+
+ProbeResult = tuple[str, bool, Optional[float], float]
+
+# Per-request timeout for a single health probe.
+PROBE_TIMEOUT_SECONDS = 5.0
+# Upper bound on a whole probe round; stragglers past it count as unhealthy.
+PROBE_ROUND_DEADLINE_SECONDS = 8.0
+PROBE_WORKERS = 4
+# Endpoints whose slot is further than this from the cluster median are treated as stale.
+MAX_SLOT_DRIFT = 2
+
+
+def reject_out_of_sync(
+    results: list[ProbeResult], slots: dict[str, int], max_drift: int = MAX_SLOT_DRIFT
+) -> list[ProbeResult]:
+    """Mark endpoints whose reported slot strays from the cluster as unhealthy.
+
+    A lagging or forked RPC node can still answer quickly, so latency alone
+    isn't enough to pick it. ``slots`` maps URL to the slot each healthy
+    endpoint reported. Three or more readings are compared against their
+    median; with only two the median can't tell which one is off, so the
+    higher slot is trusted and only a lagging endpoint is rejected. A single
+    reading has nothing to compare against and ``results`` is returned
+    unchanged, which is the case for the built-in one-endpoint pools until
+    more endpoints are configured.
+    """
+
+    if len(slots) < 2:
+        return results
+    reference_slot = statistics.median(slots.values()) if len(slots) >= 3 else max(slots.values())
+    return [
+        (url, False, latency_ms, checked_at)
+        if url in slots and abs(slots[url] - reference_slot) > max_drift
+        else (url, healthy, latency_ms, checked_at)
+        for url, healthy, latency_ms, checked_at in results
+    ]
 
 
 class NetworkMonitor(QObject):
-    """Periodically ping RPC endpoints for the active cluster."""
+    """Periodically ping RPC endpoints for the active cluster.
+
+    Probes run on a worker thread so slow or dead endpoints never block the
+    UI; results are marshalled back to the UI thread through a queued signal.
+    """
+
+    _probes_finished = Signal(object, object)
 
     def __init__(
         self,
@@ -26,6 +70,17 @@ class NetworkMonitor(QObject):
         self._timer = QTimer(self)
         self._timer.setInterval(interval_ms)
         self._timer.timeout.connect(self._poll)  # type: ignore[arg-type]
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rpc-health")
+        # Individual pings fan out here so a dead endpoint doesn't delay the rest.
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=PROBE_WORKERS, thread_name_prefix="rpc-probe"
+        )
+        # One client per URL so repeated probes reuse warm keep-alive connections.
+        self._clients: dict[str, Client] = {}
+        self._in_flight: Optional[Future] = None
+        self._poll_again = False
+        self._stopped = False
+        self._probes_finished.connect(self._apply_results)
 
     def start(self) -> None:
         """Start polling and perform an immediate check."""
@@ -34,9 +89,12 @@ class NetworkMonitor(QObject):
         self._timer.start()
 
     def stop(self) -> None:
-        """Halt polling."""
+        """Halt polling and release the probe threads; a stopped monitor stays stopped."""
 
+        self._stopped = True
         self._timer.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._probe_pool.shutdown(wait=False, cancel_futures=True)
 
     def force_poll(self) -> None:
         """Trigger a manual health check."""
@@ -44,26 +102,76 @@ class NetworkMonitor(QObject):
         self._poll()
 
     def _poll(self) -> None:
+        if self._stopped:
+            return
+        if self._in_flight is not None and not self._in_flight.done():
+            # Don't stack probe rounds; run one more once the current round lands.
+            self._poll_again = True
+            return
+
         network = self.wallet_state.network
-        endpoints = self.wallet_state.endpoint_statuses_for_network(network)
-        for endpoint in endpoints:
-            healthy, latency_ms = self._ping_endpoint(endpoint.url)
-            self.wallet_state.record_endpoint_check(
-                endpoint.url, healthy, latency_ms, time.time(), network
-            )
-
-        current = self.wallet_state.current_endpoint_status(network)
-        if current.healthy is False:
+        urls = [
+            endpoint.url
+            for endpoint in self.wallet_state.endpoint_statuses_for_network(network)
+        ]
+        self._in_flight = self._executor.submit(self._probe_all, network, urls)
+
+    def _probe_all(self, network: Network, urls: list[str]) -> None:
+        """Worker-thread body: ping every endpoint and hand results to the UI thread."""
+
+        pending = {self._probe_pool.submit(self._ping_endpoint, url): url for url in urls}
+        results: list[ProbeResult] = []
+        slots: dict[str, int] = {}
+        try:
+            for future in as_completed(list(pending), timeout=PROBE_ROUND_DEADLINE_SECONDS):
+                url = pending.pop(future)
+                healthy, latency_ms, slot = future.result()
+                results.append((url, healthy, latency_ms, time.time()))
+                if slot is not None:
+                    slots[url] = slot
+        except TimeoutError:
+            finished_at = time.time()
+            for future, url in pending.items():
+                future.cancel()
+                results.append((url, False, None, finished_at))
+        self._probes_finished.emit(network, reject_out_of_sync(results, slots))
+
+    def _apply_results(self, network: Network, results: list[ProbeResult]) -> None:
+        if self._stopped:
+            # A round that was in flight when stop() ran lands here; drop it.
+            return
+        slot = self.wallet_state.record_endpoint_checks(results, network)
+        if slot.active_endpoint.healthy is False:
             self.wallet_state.advance_to_next_endpoint(network)
 
-    def _ping_endpoint(self, url: str) -> tuple[bool, Optional[float]]:
+        if self._poll_again:
+            self._poll_again = False
+            self._poll()
+
+    def _client_for(self, url: str) -> Client:
+        client = self._clients.get(url)
+        if client is None:
+            # setdefault keeps a single client if two probe threads race here.
+            client = self._clients.setdefault(url, Client(url, timeout=PROBE_TIMEOUT_SECONDS))
+        return client
+
+    def _ping_endpoint(self, url: str) -> tuple[bool, Optional[float], Optional[int]]:
+        """Return ``(healthy, latency_ms, slot)``; the slot is ``None`` when unknown."""
+
         start = time.perf_counter()
         try:
-            client = Client(url)
+            client = self._client_for(url)
             response = client.get_health()
             latency_ms = (time.perf_counter() - start) * 1000
             value = getattr(response, "value", None)
             healthy = value in {"ok", "healthy", True, None}
-            return healthy, latency_ms
         except Exception:
-            return False, None
+            return False, None, None
+        if not healthy:
+            return False, latency_ms, None
+        try:
+            slot = int(client.get_slot().value)
+        except Exception:
+            # Health answered; a missing slot only excludes it from the sync check.
+            slot = None
+        return True, latency_ms, slot
@@ -2,23 +2,82 @@
 
 from __future__ import annotations
 
-import secrets
+import asyncio
+import functools
+import os
+import random
+import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, Literal, Optional
-
-from solana.rpc.api import Client
-from solders.keypair import Keypair
-from solders.pubkey import Pubkey
+from enum import IntEnum
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Iterator, Literal, Mapping, NamedTuple, Optional, TypeVar
 
 from .lock_manager import LockManager
 
-Network = Literal["Mainnet", "Testnet", "Devnet"]
-TokenProgram = Literal["Token-2022", "Token"]
-NETWORKS: list[Network] = ["Mainnet", "Testnet", "Devnet"]
+if TYPE_CHECKING:
+    # RPC and key libraries are imported where they are used so that code which
+    # only needs WalletState (e.g. the UI layer) doesn't pay for loading them.
+    import httpx
+    from solana.rpc.api import Client
+    from solders.keypair import Keypair
+
+_T = TypeVar("_T")
+
+
+class Network(IntEnum):
+    """Supported clusters; values double as indices into per-network storage."""
+
+    MAINNET = 0
+    TESTNET = 1
+    DEVNET = 2
+
+    @property
+    def label(self) -> str:
+        """Human-facing cluster name used by the UI and explorer links."""
+
+        return self.name.capitalize()
 
+    @classmethod
+    def coerce(cls, value: "Network | str") -> "Network":
+        """Accept either an enum member or its UI label (e.g. ``"Devnet"``)."""
 
-@dataclass
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).upper()]
+        except KeyError as exc:
+            raise ValueError(f"Unknown network: {value}") from exc
+
+    def __str__(self) -> str:
+        return self.label
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.label, format_spec)
+
+
+TokenProgram = Literal["Token-2022", "Token"]
+BreakerState = Literal["closed", "open", "half-open"]
+NETWORKS: tuple[Network, ...] = tuple(Network)
+
+# Weight of the newest sample in the smoothed endpoint latency.
+LATENCY_EWMA_ALPHA = 0.3
+# Consecutive failures that open an endpoint's circuit breaker.
+BREAKER_FAILURE_THRESHOLD = 3
+# Seconds an open breaker waits before allowing a half-open trial request.
+BREAKER_RECOVERY_SECONDS = 30.0
+# Multiplier applied to an endpoint's selection weight when it is rotated away from.
+ENDPOINT_WEIGHT_PENALTY = 0.5
+# Seconds for a "last known good" bonus to decay by half.
+LAST_GOOD_HALF_LIFE_SECONDS = 120.0
+# Latency assumed for endpoints that have never been timed when ranking candidates.
+UNMEASURED_LATENCY_MS = 1000.0
+# Upper bound on worker threads a single batch transfer may use.
+MAX_TRANSFER_WORKERS = 16
+
+
+@dataclass(slots=True)
 class EndpointStatus:
     """Metadata for a single RPC endpoint within a cluster."""
 
@@ -29,50 +88,104 @@ class EndpointStatus:
     latency_ms: Optional[float] = None
     last_checked: Optional[float] = None
     supports_token2022: bool = False
+    ewma_latency_ms: Optional[float] = None
+    consecutive_failures: int = 0
+    opened_at: Optional[float] = None
+    weight: float = 1.0
+    last_good_at: Optional[float] = None
+
+    def mark_result(
+        self, healthy: bool, latency_ms: Optional[float], timestamp: Optional[float] = None
+    ) -> None:
+        """Record the outcome of a health probe or RPC call.
 
-    def mark_result(self, healthy: bool, latency_ms: Optional[float]) -> None:
-        """Record the outcome of a health probe."""
+        A ``latency_ms`` of ``None`` means the call was not timed, so the
+        previous latency sample is kept.
+        """
 
+        now = time.time() if timestamp is None else timestamp
         self.healthy = healthy
-        self.latency_ms = latency_ms
-        self.last_checked = time.time()
+        self.last_checked = now
+        if latency_ms is not None:
+            self.latency_ms = latency_ms
+            self.ewma_latency_ms = (
+                latency_ms
+                if self.ewma_latency_ms is None
+                else LATENCY_EWMA_ALPHA * latency_ms
+                + (1 - LATENCY_EWMA_ALPHA) * self.ewma_latency_ms
+            )
 
+        if healthy:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.last_good_at = now
+            self.weight = min(1.0, self.weight * 2)
+            return
+        self.consecutive_failures += 1
+        if (
+            self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD
+            and self.breaker_state(now) != "open"
+        ):
+            # Trip from closed, or re-open after a failed half-open trial.
+            self.opened_at = now
+
+    def breaker_state(self, now: Optional[float] = None) -> BreakerState:
+        """Return the circuit-breaker state derived from recent failures."""
+
+        if self.opened_at is None:
+            return "closed"
+        elapsed = (time.time() if now is None else now) - self.opened_at
+        return "open" if elapsed < BREAKER_RECOVERY_SECONDS else "half-open"
+
+
+def _endpoint_rank_key(now: float) -> Callable[[EndpointStatus], tuple[bool, int, float, int]]:
+    """Return a sort key ranking endpoints from most to least preferred at ``now``."""
 
-def _default_endpoint_matrix() -> dict[Network, list[EndpointStatus]]:
-    """Return the default ordered endpoint list for each supported network."""
+    # Skip open breakers, prefer healthy over unknown over unhealthy, then the
+    # lowest smoothed latency; lowest priority breaks ties.
+    def sort_key(ep: EndpointStatus) -> tuple[bool, int, float, int]:
+        health_rank = 0 if ep.healthy else (1 if ep.healthy is None else 2)
+        latency = ep.ewma_latency_ms if ep.ewma_latency_ms is not None else float("inf")
+        return (ep.breaker_state(now) == "open", health_rank, latency, ep.priority)
 
-    return {
-        "Mainnet": [
+    return sort_key
+
+
+def _default_endpoints(network: Network) -> list[EndpointStatus]:
+    """Return the default ordered endpoint list for ``network``."""
+
+    if network is Network.MAINNET:
+        return [
             EndpointStatus(
                 url="https://api.mainnet-beta.solana.com",
                 label="Solana Foundation",  # default public endpoint
                 priority=0,
                 supports_token2022=True,
             ),
-        ],
-        "Testnet": [
+        ]
+    if network is Network.TESTNET:
+        return [
             EndpointStatus(
                 url="https://api.testnet.solana.com",
                 label="Solana Foundation",  # default public endpoint
                 priority=0,
                 supports_token2022=False,
             ),
-        ],
-        "Devnet": [
-            EndpointStatus(
-                url="https://api.devnet.solana.com",
-                label="Solana Foundation",  # default public endpoint
-                priority=0,
-                supports_token2022=True,
-            ),
-        ],
-    }
+        ]
+    return [
+        EndpointStatus(
+            url="https://api.devnet.solana.com",
+            label="Solana Foundation",  # default public endpoint
+            priority=0,
+            supports_token2022=True,
+        ),
+    ]
 
 
-NETWORK_ENDPOINTS: dict[Network, list[tuple[str, str]]] = {
-    network: [(status.label, status.url) for status in endpoints]
-    for network, endpoints in _default_endpoint_matrix().items()
-}
+NETWORK_ENDPOINTS: tuple[tuple[tuple[str, str], ...], ...] = tuple(
+    tuple((status.label, status.url) for status in _default_endpoints(network))
+    for network in NETWORKS
+)
 
 TOKEN_PROGRAM_IDS: dict[TokenProgram, str] = {
     "Token-2022": "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb",
@@ -83,6 +196,113 @@ DEFAULT_RENT_EXEMPT_LAMPORTS = 2_039_280
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
+INVALID_RECIPIENT_MESSAGE = "Recipient is not a valid base58 address"
+_BASE58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def is_base58_pubkey(value: str) -> bool:
+    """Cheaply check that ``value`` looks like a base58 public key.
+
+    Only the length and alphabet are checked. That is enough to reject typos
+    before spending an RPC round-trip without paying for a full decode.
+    """
+
+    if not 32 <= len(value) <= 44 or not value.isascii():
+        return False
+    # Deleting every alphabet byte leaves nothing behind for a valid key.
+    return not value.encode("ascii").translate(None, _BASE58_ALPHABET)
+
+
+# Idle connections kept open in the shared JSON-RPC HTTP pool.
+HTTP_KEEPALIVE_CONNECTIONS = 16
+
+# Hedged RPC calls: wait this long on the primary before also asking backups.
+HEDGE_AFTER_SECONDS = 0.08
+# Number of backup endpoints raced against a slow primary.
+HEDGE_FANOUT = 2
+# Per-request timeout for pooled solana-py clients.
+RPC_TIMEOUT_SECONDS = 10.0
+# Overall budget for a hedged call before every outstanding endpoint is failed.
+RPC_DEADLINE_SECONDS = 10.0
+# JSON-RPC error codes that mean a busy or lagging node rather than a bad request.
+RETRYABLE_RPC_CODES = frozenset({-32005, 429, 503})
+
+
+class RpcError(RuntimeError):
+    """Raised when a node answers a JSON-RPC call with an error object."""
+
+    def __init__(self, method: str, code: Optional[int], message: object) -> None:
+        super().__init__(f"{method} failed: {message}")
+        self.method = method
+        self.code = code
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Return whether another endpoint might succeed where this call failed.
+
+    Transport failures, timeouts, throttling and 5xx replies are worth
+    retrying elsewhere. JSON-RPC errors outside ``RETRYABLE_RPC_CODES``,
+    other 4xx replies and malformed payloads would fail the same way on
+    every node.
+    """
+
+    if isinstance(exc, RpcError):
+        return exc.code in RETRYABLE_RPC_CODES
+    # httpx.HTTPStatusError carries the response; transport errors do not.
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return not isinstance(exc, ValueError)
+
+
+def _placeholder_blockhash() -> str:
+    """Return a random stand-in blockhash for offline previews.
+
+    Nothing is ever signed against it, so a non-cryptographic generator is
+    enough and leaves the urandom pool for signatures.
+    """
+
+    return f"{random.getrandbits(128):032x}"
+
+
+def _blockhash_from_reply(reply: Optional[dict]) -> Optional[str]:
+    """Extract the blockhash from a ``getLatestBlockhash`` reply, if present."""
+
+    try:
+        return str(reply["result"]["value"]["blockhash"])  # type: ignore[index]
+    except (KeyError, TypeError):
+        return None
+
+
+def _fee_from_reply(reply: Optional[dict]) -> Optional[int]:
+    """Extract lamports per signature from a ``getFees`` reply, if present."""
+
+    try:
+        return int(reply["result"]["value"]["feeCalculator"]["lamportsPerSignature"])  # type: ignore[index]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _balance_from_reply(reply: Optional[dict]) -> Optional[int]:
+    """Extract the lamport balance from a ``getBalance`` reply, if present."""
+
+    try:
+        return int(reply["result"]["value"])  # type: ignore[index]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+# Nominal per-signature fee used when the RPC node cannot report one.
+DEFAULT_LAMPORTS_PER_SIGNATURE = 5000
+
+# Blockhashes stay valid for ~60-90s; reuse one for transfers issued within this window.
+BLOCKHASH_TTL_SECONDS = 30
+# Per-signature fees change rarely, so they are cached much longer than blockhashes.
+FEE_TTL_SECONDS = 300
+
+# Placeholder signatures/addresses are carved out of one urandom read of this size.
+ENTROPY_POOL_BYTES = 4096
+
 
 def _program_id(token_program: TokenProgram) -> str:
     """Return the canonical program id for the given token program."""
@@ -108,7 +328,7 @@ class TokenProgramUnsupportedError(RuntimeError):
         self.program = program
 
 
-@dataclass
+@dataclass(slots=True)
 class InstructionStep:
     """Lightweight placeholder for an instruction plan used by the UI preview flows."""
 
@@ -119,24 +339,43 @@ class InstructionStep:
     signers: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransferHookConfig:
-    """Configuration required to enable transfer hooks on a new mint."""
+    """Configuration required to enable transfer hooks on a new mint.
+
+    ``validation_accounts`` may be given as any iterable; it is stored as a
+    tuple so the config stays immutable and hashable.
+    """
 
     hook_program: str
-    validation_accounts: Optional[list[str]] = None
+    validation_accounts: Optional[tuple[str, ...]] = None
+
+    def __post_init__(self) -> None:
+        if self.validation_accounts is not None:
+            object.__setattr__(self, "validation_accounts", tuple(self.validation_accounts))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InterestBearingConfig:
-    """Parameters for initializing an interest-bearing token-2022 mint."""
+    """Parameters for initializing an interest-bearing token-2022 mint.
+
+    ``initialization_data`` may be given as a mapping; it is stored as a
+    tuple of ``(key, value)`` pairs so the config stays immutable and
+    hashable as long as the values are.
+    """
 
     rate_basis_points: int
     authority: str
-    initialization_data: Optional[dict[str, object]] = None
+    initialization_data: Optional[tuple[tuple[str, object], ...]] = None
+
+    def __post_init__(self) -> None:
+        data = self.initialization_data
+        if data is not None:
+            items = data.items() if isinstance(data, Mapping) else data
+            object.__setattr__(self, "initialization_data", tuple(items))
 
 
-@dataclass
+@dataclass(slots=True)
 class MintInfo:
     """Snapshot of mint settings derived from RPC responses."""
 
@@ -149,7 +388,7 @@ class MintInfo:
     interest_authority: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionHistoryEntry:
     """Lightweight representation of a historical transaction."""
 
@@ -162,8 +401,55 @@ class TransactionHistoryEntry:
     error: Optional[str] = None
 
 
-@dataclass
-class TransferRequest:
+@dataclass(slots=True)
+class TokenBucket:
+    """Token-bucket rate limiter shared by sync and async transfer paths.
+
+    Tokens accrue at ``refill_rate`` per second up to ``capacity``, so time
+    spent waiting on slow RPC calls counts toward the next send instead of
+    being followed by a fixed sleep. ``clock`` defaults to
+    ``time.monotonic`` and is only swapped out by tests.
+    """
+
+    refill_rate: float
+    capacity: float = 1.0
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    tokens: float = field(init=False)
+    last: float = field(init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.capacity
+        self.last = self.clock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+            self.last = now
+            # Going negative reserves a future token, so concurrent callers queue
+            # up behind each other instead of all waking at once.
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.refill_rate
+
+    async def acquire(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def acquire_blocking(self) -> None:
+        """Block the calling thread until a token is available."""
+
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class TransferRequest(NamedTuple):
     """Single transfer entry used by the UI and controller."""
 
     recipient_label: str
@@ -171,8 +457,7 @@ class TransferRequest:
     amount_sol: float
 
 
-@dataclass
-class TransferResult:
+class TransferResult(NamedTuple):
     """Lightweight status object for transfers."""
 
     request: TransferRequest
@@ -183,7 +468,7 @@ class TransferResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssociatedTokenAccount:
     """Simple in-memory representation of an ATA for preview flows."""
 
@@ -193,12 +478,99 @@ class AssociatedTokenAccount:
     balance: float = 0.0
     rent_lamports: int = DEFAULT_RENT_EXEMPT_LAMPORTS
 
+    def __post_init__(self) -> None:
+        # Program names arrive from UI widgets as fresh strings; intern them so
+        # every record shares one object per program name.
+        self.token_program = sys.intern(self.token_program)
+
+
+@dataclass(slots=True)
+class NetworkSlot:
+    """Per-network endpoint and ATA state, grouped so one index resolves all of it."""
+
+    endpoints: list[EndpointStatus]
+    active_index: int = 0
+    # Insertion-ordered ATA indexes; every account appears in both.
+    accounts_by_address: dict[str, AssociatedTokenAccount] = field(default_factory=dict)
+    accounts_by_mint: dict[str, list[AssociatedTokenAccount]] = field(default_factory=dict)
+
+    @property
+    def active_endpoint(self) -> EndpointStatus:
+        """Return the endpoint currently selected for this network."""
+
+        return self.endpoints[self.active_index]
+
+    def iter_candidates(
+        self, exclude: Optional[int] = None, now: Optional[float] = None
+    ) -> Iterator[int]:
+        """Yield endpoint indexes from most to least preferred.
+
+        Endpoints whose breaker is open are skipped until their recovery
+        window lets a half-open trial through. Endpoints known to be
+        unhealthy come last. Otherwise candidates are
+        ranked by expected cost: smoothed latency divided by ``weight``,
+        discounted by how recently they were last seen healthy. Ties fall
+        back to round-robin order after the active index.
+        """
+
+        now = time.time() if now is None else now
+        count = len(self.endpoints)
+
+        def sort_key(index: int) -> tuple[bool, float, int]:
+            endpoint = self.endpoints[index]
+            recency = 0.0
+            if endpoint.last_good_at is not None:
+                age = max(0.0, now - endpoint.last_good_at)
+                recency = 0.5 ** (age / LAST_GOOD_HALF_LIFE_SECONDS)
+            latency = (
+                endpoint.ewma_latency_ms
+                if endpoint.ewma_latency_ms is not None
+                else UNMEASURED_LATENCY_MS
+            )
+            cost = latency / (endpoint.weight * (1.0 + recency))
+            return (endpoint.healthy is False, cost, (index - self.active_index) % count)
+
+        for index in sorted(range(count), key=sort_key):
+            if index != exclude and self.endpoints[index].breaker_state(now) != "open":
+                yield index
+
+    def add_account(self, account: AssociatedTokenAccount) -> None:
+        """Index an ATA by address and mint."""
+
+        self.accounts_by_address[account.address] = account
+        self.accounts_by_mint.setdefault(account.mint, []).append(account)
+
+    def remove_account(self, address: str) -> Optional[AssociatedTokenAccount]:
+        """Drop an ATA from both indexes, returning it if it was tracked."""
+
+        account = self.accounts_by_address.pop(address, None)
+        if account is not None:
+            siblings = self.accounts_by_mint[account.mint]
+            siblings.remove(account)
+            if not siblings:
+                del self.accounts_by_mint[account.mint]
+        return account
+
+    def replace_accounts(self, accounts: Iterable[AssociatedTokenAccount]) -> None:
+        """Rebuild both indexes from ``accounts``."""
+
+        self.accounts_by_address = {}
+        self.accounts_by_mint = {}
+        for account in accounts:
+            self.add_account(account)
+
+
+def _empty_network_slots() -> list[Optional[NetworkSlot]]:
+    """Return per-network placeholders; each slot is built on first access."""
+
+    return [None] * len(NETWORKS)
 
-@dataclass
+
+@dataclass(slots=True)
 class WalletState:
     """Represents the minimal visible state for the treasury wallet."""
 
-    network: Network = "Devnet"
+    network: Network = Network.DEVNET
     token_program: TokenProgram = "Token-2022"
     public_key: Optional[str] = None
     sol_balance: Optional[float] = None
@@ -207,29 +579,32 @@ class WalletState:
     decrypting: bool = False
     unlock_error: Optional[str] = None
     pending_actions: list[str] = field(default_factory=list)
-    associated_accounts: dict[Network, list["AssociatedTokenAccount"]] = field(
-        default_factory=lambda: {network: [] for network in NETWORKS}
-    )
-    endpoint_statuses: dict[Network, list[EndpointStatus]] = field(
-        default_factory=lambda: {
-            network: [EndpointStatus(label, url) for label, url in NETWORK_ENDPOINTS[network]]
-            for network in NETWORKS
-        }
-    )
-    active_endpoint_index: dict[Network, int] = field(
-        default_factory=lambda: {network: 0 for network in NETWORKS}
-    )
+    # Indexed by ``Network`` value; entries stay ``None`` until ``slot()`` builds them.
+    slots: list[Optional[NetworkSlot]] = field(default_factory=_empty_network_slots)
     _endpoint_listeners: list[Callable[[], None]] = field(default_factory=list, repr=False)
+    # Resolved on-chain id for ``token_program``; refreshed by ``set_token_program``.
+    token_program_id: str = field(init=False, repr=False, default="")
+    # Abbreviated ``public_key`` for the status bar; refreshed by ``set_public_key``.
+    short_public_key: Optional[str] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        self.token_program = sys.intern(self.token_program)
+        self.token_program_id = _program_id(self.token_program)
+        self.set_public_key(self.public_key)
+
+    def set_public_key(self, public_key: Optional[str]) -> None:
+        """Store the active public key along with its abbreviated form."""
+
+        self.public_key = public_key
+        self.short_public_key = f"{public_key[:4]}…{public_key[-4:]}" if public_key else None
 
     def status_line(self) -> str:
         if self.locked:
             return "Locked · No key loaded"
-        if self.public_key:
-            short = f"{self.public_key[:4]}…{self.public_key[-4:]}"
-            balance = (
-                f" · {self.sol_balance:.4f} SOL" if self.sol_balance is not None else ""
-            )
-            return f"Active on {self.network} · {short}{balance}"
+        if self.short_public_key:
+            if self.sol_balance is None:
+                return f"Active on {self.network} · {self.short_public_key}"
+            return f"Active on {self.network} · {self.short_public_key} · {self.sol_balance:.4f} SOL"
         return f"Unlocked on {self.network}"
 
     def toggle_lock(self) -> None:
@@ -237,40 +612,79 @@ class WalletState:
 
         self.locked = not self.locked
 
-    def switch_network(self, network: Network) -> None:
-        """Update the active cluster."""
+    def switch_network(self, network: Network | str) -> None:
+        """Update the active cluster.
+
+        Accepts the UI label (``"Devnet"``) as well as a :class:`Network` member.
+        """
 
-        self.network = network
+        self.network = Network.coerce(network)
         self._notify_endpoint_update()
 
     def set_token_program(self, token_program: TokenProgram) -> None:
         """Persist the user's chosen token program for ATA previews."""
 
-        self.token_program = token_program
+        self.token_program = sys.intern(token_program)
+        self.token_program_id = _program_id(token_program)
 
     def set_active_mint(self, mint: Optional[str]) -> None:
         """Track the mint currently in focus for history lookups."""
 
         self.active_mint = mint
 
+    def slot(self, network: Optional[Network] = None) -> NetworkSlot:
+        """Return the per-network state for the given or active network.
+
+        Slots are created lazily so short-lived states only build the
+        networks they actually touch.
+        """
+
+        resolved = network if network is not None else self.network
+        slot = self.slots[resolved]
+        if slot is None:
+            slot = NetworkSlot(endpoints=_default_endpoints(resolved))
+            self.slots[resolved] = slot
+        return slot
+
     def associated_accounts_for_network(self, network: Optional[Network] = None) -> list[
         AssociatedTokenAccount
     ]:
         """Return the cached ATAs for the given or active network."""
 
-        return self.associated_accounts[network or self.network]
+        return list(self.slot(network).accounts_by_address.values())
+
+    def associated_account(
+        self, address: str, network: Optional[Network] = None
+    ) -> Optional[AssociatedTokenAccount]:
+        """Return the cached ATA with the given address, if any."""
+
+        return self.slot(network).accounts_by_address.get(address)
+
+    def associated_accounts_for_mint(
+        self, mint: str, network: Optional[Network] = None
+    ) -> list[AssociatedTokenAccount]:
+        """Return the cached ATAs holding ``mint`` for the given or active network."""
+
+        return list(self.slot(network).accounts_by_mint.get(mint, ()))
 
     def replace_associated_accounts(
-        self, accounts: list[AssociatedTokenAccount], network: Optional[Network] = None
+        self, accounts: Iterable[AssociatedTokenAccount], network: Optional[Network] = None
     ) -> None:
         """Update the ATA cache for the active or specified network."""
 
-        self.associated_accounts[network or self.network] = accounts
+        self.slot(network).replace_accounts(accounts)
 
     def add_associated_account(self, account: AssociatedTokenAccount) -> None:
         """Store a new ATA preview for the active network."""
 
-        self.associated_accounts[self.network].append(account)
+        self.slot().add_account(account)
+
+    def remove_associated_account(
+        self, address: str, network: Optional[Network] = None
+    ) -> Optional[AssociatedTokenAccount]:
+        """Drop an ATA from the cache, returning it if it was tracked."""
+
+        return self.slot(network).remove_account(address)
 
     def enqueue_action(self, description: str) -> None:
         """Record a future action in the activity list."""
@@ -283,20 +697,22 @@ class WalletState:
         self._endpoint_listeners.append(listener)
 
     def _notify_endpoint_update(self) -> None:
-        for listener in self._endpoint_listeners:
+        listeners = self._endpoint_listeners
+        if not listeners:
+            # Most controller-only flows have no UI listening; skip the loop setup.
+            return
+        for listener in listeners:
             listener()
 
     def endpoint_statuses_for_network(self, network: Optional[Network] = None) -> list[EndpointStatus]:
         """Return all known endpoints for the given or active network."""
 
-        return self.endpoint_statuses[network or self.network]
+        return self.slot(network).endpoints
 
     def current_endpoint_status(self, network: Optional[Network] = None) -> EndpointStatus:
         """Return the active endpoint status record for the network."""
 
-        active_network = network or self.network
-        index = self.active_endpoint_index[active_network]
-        return self.endpoint_statuses_for_network(active_network)[index]
+        return self.slot(network).active_endpoint
 
     @property
     def current_endpoint_url(self) -> str:
@@ -314,36 +730,43 @@ class WalletState:
     ) -> None:
         """Update health metadata for the endpoint matching the given URL."""
 
-        target_network = network or self.network
-        for status in self.endpoint_statuses_for_network(target_network):
-            if status.url == url:
-                status.healthy = healthy
-                status.last_latency_ms = latency_ms
-                status.last_checked = timestamp
-                break
+        self.record_endpoint_checks([(url, healthy, latency_ms, timestamp)], network)
+
+    def record_endpoint_checks(
+        self,
+        results: Iterable[tuple[str, bool, Optional[float], float]],
+        network: Optional[Network] = None,
+    ) -> NetworkSlot:
+        """Apply a round of ``(url, healthy, latency_ms, timestamp)`` results.
+
+        The network is resolved once and listeners are notified once for the
+        whole round. Returns the updated slot so callers can inspect it
+        without resolving the network again.
+        """
+
+        slot = self.slot(network)
+        by_url = {status.url: status for status in slot.endpoints}
+        for url, healthy, latency_ms, timestamp in results:
+            status = by_url.get(url)
+            if status is not None:
+                status.mark_result(healthy, latency_ms, timestamp)
         self._notify_endpoint_update()
+        return slot
 
     def advance_to_next_endpoint(self, network: Optional[Network] = None) -> EndpointStatus:
-        """Rotate to the next healthy (or least unhealthy) endpoint for the network."""
+        """Switch to the best-weighted alternative endpoint for the network."""
 
-        target_network = network or self.network
-        endpoints = self.endpoint_statuses_for_network(target_network)
+        slot = self.slot(network)
+        endpoints = slot.endpoints
         if not endpoints:
             raise RuntimeError("No endpoints configured")
 
-        current_index = self.active_endpoint_index[target_network]
-        for offset in range(1, len(endpoints) + 1):
-            candidate_index = (current_index + offset) % len(endpoints)
-            candidate = endpoints[candidate_index]
-            if candidate.healthy is not False:
-                self.active_endpoint_index[target_network] = candidate_index
-                self._notify_endpoint_update()
-                return candidate
-
-        # If all endpoints are marked unhealthy, still rotate to the next one.
-        self.active_endpoint_index[target_network] = (current_index + 1) % len(endpoints)
+        current_index = slot.active_index
+        # Demote the endpoint we're leaving so a flaky one isn't picked straight back.
+        endpoints[current_index].weight *= ENDPOINT_WEIGHT_PENALTY
+        slot.active_index = next(slot.iter_candidates(exclude=current_index), current_index)
         self._notify_endpoint_update()
-        return endpoints[self.active_endpoint_index[target_network]]
+        return slot.active_endpoint
 
 
 def create_mint_instructions(
@@ -400,11 +823,10 @@ def create_mint_instructions(
             InstructionStep(
                 name="configure_transfer_hook",
                 program_id=program_id,
-                accounts=[mint_address, *(transfer_hook.validation_accounts or [])],
+                accounts=[mint_address, *(transfer_hook.validation_accounts or ())],
                 data={
                     "hook_program": transfer_hook.hook_program,
-                    "validation_accounts": transfer_hook.validation_accounts
-                    or [],
+                    "validation_accounts": list(transfer_hook.validation_accounts or ()),
                 },
                 signers=[mint_authority],
             )
@@ -435,7 +857,7 @@ def create_mint_instructions(
                 name="initialize_interest_bearing_extension",
                 program_id=program_id,
                 accounts=[mint_address],
-                data=interest_bearing.initialization_data or {},
+                data=dict(interest_bearing.initialization_data or ()),
                 signers=[interest_bearing.authority],
             )
         )
@@ -527,8 +949,35 @@ class WalletController:
         self.state = state
         self.lock_manager = lock_manager
         self._keypair: Optional[Keypair] = None
-        self.endpoints: dict[Network, list[EndpointStatus]] = _default_endpoint_matrix()
+        # Derived from the keypair once so RPC calls don't re-encode it.
+        self._pubkey_str: Optional[str] = None
         self._demo_passphrase = "treasury"
+        # Per-network ``(value, monotonic fetch time)``; only real RPC answers are cached.
+        self._blockhash_cache: dict[Network, tuple[str, float]] = {}
+        self._fee_cache: dict[Network, tuple[int, float]] = {}
+        # Identical RPC reads issued concurrently share one in-flight request.
+        self._inflight: dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # One pooled client (and HTTP session) per RPC URL, reused across calls.
+        self._clients: dict[str, Client] = {}
+        # Hot-path JSON-RPC calls bypass solana-py and share one keep-alive HTTP pool.
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+        self._entropy_pool = b""
+        self._entropy_offset = 0
+        self._entropy_lock = threading.Lock()
+        self._rate_bucket: Optional[TokenBucket] = None
+        # Last ``(form snapshot, payload)`` from ``build_mint_payload``.
+        self._mint_payload_cache: Optional[tuple[tuple, dict]] = None
+        # Reused across calls for independent, I/O-bound RPC fan-out.
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # Separate from the I/O pool so hedged calls made from I/O tasks can't starve it.
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_pool_lock = threading.Lock()
+
+        if self.lock_manager:
+            self.lock_manager.subscribe_unlock(self._receive_unlock)
+            self.lock_manager.subscribe_lock(self._receive_lock)
 
     @property
     def demo_passphrase(self) -> str:
@@ -536,10 +985,6 @@ class WalletController:
 
         return self._demo_passphrase
 
-        if self.lock_manager:
-            self.lock_manager.subscribe_unlock(self._receive_unlock)
-            self.lock_manager.subscribe_lock(self._receive_lock)
-
     def set_token_program(self, token_program: TokenProgram) -> None:
         """Update the active token program preference."""
 
@@ -550,7 +995,7 @@ class WalletController:
 
         start = time.perf_counter()
         try:
-            client = Client(endpoint.url)
+            client = self._client_for(endpoint)
             client.get_latest_blockhash()
             latency_ms = (time.perf_counter() - start) * 1000
             endpoint.mark_result(True, latency_ms)
@@ -562,7 +1007,7 @@ class WalletController:
     def current_token_program_id(self) -> str:
         """Return the on-chain program id for the selected SPL token program."""
 
-        return TOKEN_PROGRAM_IDS[self.state.token_program]
+        return self.state.token_program_id
 
     def token2022_supported(self, network: Optional[Network] = None) -> bool:
         """Return whether the selected or provided network supports token-2022."""
@@ -600,13 +1045,18 @@ class WalletController:
         Returns the base58 secret string so it can be persisted by the caller.
         """
 
+        from solders.keypair import Keypair
+
         keypair = Keypair()
         self._apply_keypair(keypair)
-        return keypair.to_base58_string()
+        # solders renders a keypair as its base58 secret; there is no to_base58_string().
+        return str(keypair)
 
     def import_secret(self, secret_b58: str) -> str:
         """Load a keypair from a base58-encoded secret string."""
 
+        from solders.keypair import Keypair
+
         keypair = Keypair.from_base58_string(secret_b58.strip())
         self._apply_keypair(keypair)
         return str(keypair.pubkey())
@@ -618,6 +1068,17 @@ class WalletController:
         self.state.decrypting = False
         self.state.unlock_error = None
 
+    def reset(self) -> None:
+        """Discard the loaded keypair and return to a locked, keyless state."""
+
+        if self.lock_manager:
+            # The lock manager notifies ``_receive_lock`` for us.
+            self.lock_manager.lock("reset")
+        else:
+            self._receive_lock()
+        self.state.decrypting = False
+        self.state.unlock_error = None
+
     def unlock_wallet(self, passphrase: str) -> None:
         """Unlock the keypair using the demo passphrase."""
 
@@ -641,7 +1102,7 @@ class WalletController:
 
         if self._keypair is None:
             raise RuntimeError("No keypair is loaded")
-        return self._keypair.to_base58_string()
+        return str(self._keypair)
 
     def endpoint(self) -> str:
         """Return the RPC endpoint for the active network."""
@@ -654,18 +1115,52 @@ class WalletController:
         if self._keypair is None:
             return None
 
-        endpoint = self.select_endpoint()
-        client = Client(endpoint.url)
+        network = self.state.network
+        balance = self._dedup(
+            ("getBalance", network, self._pubkey_str), self._fetch_balance, network
+        )
+        if balance is not None:
+            self.state.sol_balance = balance
+        return balance
+
+    def refresh_balances_all(self) -> dict[Network, float]:
+        """Fetch the SOL balance on every network concurrently.
+
+        Networks whose RPC call fails are omitted from the result. Only the
+        active network's balance is written back to the wallet state.
+        """
+
+        if self._keypair is None:
+            return {}
+
+        pool = self._io_executor()
+        futures = {
+            pool.submit(
+                self._dedup, ("getBalance", network, self._pubkey_str), self._fetch_balance, network
+            ): network
+            for network in NETWORKS
+        }
+        balances: dict[Network, float] = {}
+        for future in as_completed(futures):
+            balance = future.result()
+            if balance is not None:
+                balances[futures[future]] = balance
+
+        active = balances.get(self.state.network)
+        if active is not None:
+            self.state.sol_balance = active
+        return balances
+
+    def _fetch_balance(self, network: Network) -> Optional[float]:
+        """Return the wallet's SOL balance on ``network``, or ``None`` on RPC failure."""
+
         try:
-            response = client.get_balance(
-                Pubkey.from_string(str(self._keypair.pubkey()))
+            result = self._with_endpoint_failover(
+                lambda endpoint: self._rpc_request(endpoint, "getBalance", [self._pubkey_str]),
+                network,
             )
-            lamports = response.value
-            self.state.sol_balance = lamports / LAMPORTS_PER_SOL
-            self._mark_endpoint_healthy(endpoint)
-            return self.state.sol_balance
+            return int(result["value"]) / LAMPORTS_PER_SOL
         except Exception:
-            self.mark_endpoint_failed(endpoint)
             return None
 
     def fetch_recent_blockhash(self) -> str:
@@ -675,49 +1170,196 @@ class WalletController:
         access fails, allowing the UI to continue presenting transfer flows.
         """
 
-        endpoint = self.select_endpoint()
-        client = Client(endpoint.url)
-        try:
-            response = client.get_latest_blockhash()
-            self._mark_endpoint_healthy(endpoint)
-            return str(response.value.blockhash)
-        except Exception:
-            self.mark_endpoint_failed(endpoint)
-            # Keep the UI responsive even when offline.
-            return secrets.token_hex(16)
+        blockhash, _ = self._cached_blockhash_and_fee()
+        # Keep the UI responsive even when offline.
+        return blockhash if blockhash is not None else _placeholder_blockhash()
 
     def estimate_fee(self, instructions: int = 1) -> int:
         """Roughly estimate the lamports required for a transfer."""
 
-        endpoint = self.select_endpoint()
-        client = Client(endpoint.url)
+        _, lamports_per_sig = self._cached_blockhash_and_fee()
+        if lamports_per_sig is None:
+            lamports_per_sig = DEFAULT_LAMPORTS_PER_SIGNATURE
+        # Assume one signature and a small bump for multiple instructions.
+        return lamports_per_sig * max(1, instructions)
+
+    def estimate_fees_bulk(self, instruction_counts: Iterable[int]) -> list[int]:
+        """Estimate fees for many transfers against a single fee lookup."""
+
+        _, lamports_per_sig = self._cached_blockhash_and_fee()
+        if lamports_per_sig is None:
+            lamports_per_sig = DEFAULT_LAMPORTS_PER_SIGNATURE
+        return [lamports_per_sig * max(1, count) for count in instruction_counts]
+
+    def prime_transaction_context(self) -> tuple[str, int]:
+        """Return a ``(blockhash, fee_lamports)`` pair, warming caches in one round-trip.
+
+        When either cached value is stale, the blockhash, fee and (if a key is
+        loaded) SOL balance are requested together in a single JSON-RPC batch,
+        refreshing the TTL caches and ``state.sol_balance``. Nothing is fetched
+        while both cached values are fresh.
+        """
+
+        network = self.state.network
+        now = time.monotonic()
+        blockhash, lamports_per_sig = self._fresh_blockhash_and_fee(network, now)
+        if blockhash is None or lamports_per_sig is None:
+            batch = [
+                {"jsonrpc": "2.0", "id": 0, "method": "getLatestBlockhash"},
+                {"jsonrpc": "2.0", "id": 1, "method": "getFees"},
+            ]
+            owner = self._pubkey_str
+            if owner is not None:
+                batch.append(
+                    {"jsonrpc": "2.0", "id": 2, "method": "getBalance", "params": [owner]}
+                )
+            try:
+                replies = self._dedup(("prime", network, owner), self._rpc_batch, batch)
+            except Exception:
+                replies = {}
+
+            fetched_blockhash = _blockhash_from_reply(replies.get(0))
+            if fetched_blockhash is not None:
+                blockhash = fetched_blockhash
+                self._blockhash_cache[network] = (blockhash, now)
+            fetched_fee = _fee_from_reply(replies.get(1))
+            if fetched_fee is None and lamports_per_sig is None and fetched_blockhash is not None:
+                # Same fallback as ``_cached_blockhash_and_fee``: cache the default fee.
+                fetched_fee = DEFAULT_LAMPORTS_PER_SIGNATURE
+            if fetched_fee is not None:
+                lamports_per_sig = fetched_fee
+                self._fee_cache[network] = (lamports_per_sig, now)
+            lamports = _balance_from_reply(replies.get(2))
+            if lamports is not None:
+                self.state.sol_balance = lamports / LAMPORTS_PER_SOL
+
+        return (
+            blockhash if blockhash is not None else _placeholder_blockhash(),
+            lamports_per_sig if lamports_per_sig is not None else DEFAULT_LAMPORTS_PER_SIGNATURE,
+        )
+
+    async def preflight_async(self) -> tuple[str, int, Optional[float]]:
+        """Awaitable :meth:`prime_transaction_context` that also returns the SOL balance.
+
+        The batched round-trip runs on a worker thread, so callers on an event
+        loop can overlap it with other work.
+        """
+
+        blockhash, fee_lamports = await asyncio.to_thread(self.prime_transaction_context)
+        return blockhash, fee_lamports, self.state.sol_balance
+
+    def _fresh_blockhash_and_fee(
+        self, network: Network, now: float
+    ) -> tuple[Optional[str], Optional[int]]:
+        """Return cached values still inside their TTLs, ``None`` for stale ones."""
+
+        blockhash_entry = self._blockhash_cache.get(network)
+        fee_entry = self._fee_cache.get(network)
+        blockhash = (
+            blockhash_entry[0]
+            if blockhash_entry is not None and now - blockhash_entry[1] < BLOCKHASH_TTL_SECONDS
+            else None
+        )
+        lamports_per_sig = (
+            fee_entry[0]
+            if fee_entry is not None and now - fee_entry[1] < FEE_TTL_SECONDS
+            else None
+        )
+        return blockhash, lamports_per_sig
+
+    def _cached_blockhash_and_fee(self) -> tuple[Optional[str], Optional[int]]:
+        """Return the blockhash and per-signature fee, refreshing only stale values.
+
+        The blockhash is reused for ``BLOCKHASH_TTL_SECONDS`` and the fee for
+        ``FEE_TTL_SECONDS``; when only the blockhash is stale, the fee is not
+        re-requested.
+        """
+
+        network = self.state.network
+        now = time.monotonic()
+        blockhash, lamports_per_sig = self._fresh_blockhash_and_fee(network, now)
+        if blockhash is not None and lamports_per_sig is not None:
+            return blockhash, lamports_per_sig
+
+        include_fee = lamports_per_sig is None
+        fetched_blockhash, fetched_fee = self._dedup(
+            ("blockhash_fee", network, include_fee),
+            functools.partial(self._fetch_blockhash_and_fee, include_fee=include_fee),
+        )
+        if fetched_blockhash is not None:
+            blockhash = fetched_blockhash
+            self._blockhash_cache[network] = (blockhash, now)
+        if fetched_fee is None and include_fee and fetched_blockhash is not None:
+            # The node answered but has no fee (e.g. getFees is gone); don't ask again
+            # until the fee TTL lapses, or every blockhash refresh would re-send it.
+            fetched_fee = DEFAULT_LAMPORTS_PER_SIGNATURE
+        if fetched_fee is not None:
+            lamports_per_sig = fetched_fee
+            self._fee_cache[network] = (lamports_per_sig, now)
+        return blockhash, lamports_per_sig
+
+    def _fetch_blockhash_and_fee(
+        self, include_fee: bool = True
+    ) -> tuple[Optional[str], Optional[int]]:
+        """Fetch the latest blockhash and per-signature fee in one JSON-RPC batch.
+
+        Either value is ``None`` when the node could not supply it (or, for the
+        fee, when ``include_fee`` is false); callers substitute their own
+        placeholders.
+        """
+
+        batch = [{"jsonrpc": "2.0", "id": 0, "method": "getLatestBlockhash"}]
+        if include_fee:
+            batch.append({"jsonrpc": "2.0", "id": 1, "method": "getFees"})
+
         try:
-            fees = self._with_endpoint_failover(lambda client: client.get_fees())
-            # Prefer the RPC value if available; fall back to a nominal fee.
-            lamports_per_sig = fees.value.fee_calculator.lamports_per_signature
-            self._mark_endpoint_healthy(endpoint)
+            replies = self._rpc_batch(batch)
         except Exception:
-            lamports_per_sig = 5000
-            self.mark_endpoint_failed(endpoint)
+            return None, None
 
-        # Assume one signature and a small bump for multiple instructions.
-        return lamports_per_sig * max(1, instructions)
+        lamports_per_sig = _fee_from_reply(replies.get(1)) if include_fee else None
+        return _blockhash_from_reply(replies.get(0)), lamports_per_sig
+
+    def _rpc_batch(self, batch: list[dict]) -> dict[object, dict]:
+        """POST a JSON-RPC batch with endpoint failover and return replies keyed by id."""
+
+        def post_batch(endpoint: EndpointStatus) -> dict[object, dict]:
+            response = self._http_client().post(endpoint.url, json=batch)
+            response.raise_for_status()
+            # Batch replies may arrive in any order; match them up by id.
+            return {reply.get("id"): reply for reply in response.json()}
+
+        return self._with_endpoint_failover(post_batch)
+
+    def _prepare_batch_context(self) -> tuple[str, int]:
+        """Return a ``(blockhash, fee_lamports)`` pair shared across transfers.
+
+        Values come from the per-network TTL caches. Offline placeholders are
+        never cached.
+        """
+
+        blockhash, lamports_per_sig = self._cached_blockhash_and_fee()
+        return (
+            blockhash if blockhash is not None else _placeholder_blockhash(),
+            lamports_per_sig if lamports_per_sig is not None else DEFAULT_LAMPORTS_PER_SIGNATURE,
+        )
 
     def list_associated_accounts(self, mint: Optional[str] = None) -> list[
         AssociatedTokenAccount
     ]:
         """Return cached ATAs for the active network, optionally filtered by mint."""
 
-        accounts = self.state.associated_accounts_for_network()
         if mint:
-            return [ata for ata in accounts if ata.mint == mint]
-        return accounts
+            return self.state.associated_accounts_for_mint(mint)
+        return self.state.associated_accounts_for_network()
 
     def fetch_mint_info(self, mint_address: str) -> MintInfo:
         """Fetch mint metadata and extension hints via RPC."""
 
+        from solders.pubkey import Pubkey
+
         endpoint = self.select_endpoint()
-        client = Client(endpoint.url)
+        client = self._client_for(endpoint)
         try:
             response = client.get_account_info(Pubkey.from_string(mint_address))
             value = response.value
@@ -759,7 +1401,28 @@ class WalletController:
             raise
 
     def build_mint_payload(self, form_state: "MintFormState") -> dict:
-        """Translate form state into a payload for mint creation or updates."""
+        """Translate form state into a payload for mint creation or updates.
+
+        The form is rebuilt on every edit, so an unchanged form and token
+        program return the previously built dict. Callers must copy it
+        before adding keys.
+        """
+
+        key = (
+            self.state.token_program,
+            form_state.mint_address,
+            form_state.transfer_hook_enabled,
+            form_state.transfer_hook_program,
+            tuple(form_state.transfer_hook_accounts or ()),
+            form_state.close_authority_enabled,
+            form_state.close_authority,
+            form_state.interest_bearing_enabled,
+            form_state.interest_rate,
+            form_state.interest_authority,
+        )
+        cached = self._mint_payload_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         payload: dict[str, object] = {
             "mint": form_state.mint_address,
@@ -770,7 +1433,7 @@ class WalletController:
         if form_state.transfer_hook_enabled and form_state.transfer_hook_program:
             payload["transfer_hook"] = {
                 "program": form_state.transfer_hook_program,
-                "accounts": form_state.transfer_hook_accounts or [],
+                "accounts": list(form_state.transfer_hook_accounts or ()),
             }
 
         if form_state.close_authority_enabled and form_state.close_authority:
@@ -782,6 +1445,7 @@ class WalletController:
                 "authority": form_state.interest_authority,
             }
 
+        self._mint_payload_cache = (key, payload)
         return payload
 
     def ensure_associated_account(self, mint: str) -> AssociatedTokenAccount:
@@ -798,7 +1462,7 @@ class WalletController:
             return existing[0]
 
         # Generate a placeholder PDA-like address for previews.
-        address = f"ata_{secrets.token_hex(16)}"
+        address = f"ata_{self._take_hex(16)}"
         account = AssociatedTokenAccount(
             address=address,
             mint=mint,
@@ -808,20 +1472,47 @@ class WalletController:
         self.state.set_active_mint(mint)
         return account
 
+    def bulk_ensure(self, mints: Iterable[str]) -> list[AssociatedTokenAccount]:
+        """Create or return ATAs for many mints at once, in input order.
+
+        Repeated mints map to the same account. Unlike
+        :meth:`ensure_associated_account`, the active mint is left unchanged.
+        """
+
+        if self._keypair is None:
+            raise RuntimeError("Load or generate a keypair to manage token accounts")
+
+        token_program = self.state.token_program
+        self.require_token_program_support(token_program)
+
+        slot = self.state.slot()
+        accounts: list[AssociatedTokenAccount] = []
+        for mint in mints:
+            existing = slot.accounts_by_mint.get(mint)
+            if existing:
+                accounts.append(existing[0])
+                continue
+            account = AssociatedTokenAccount(
+                address=f"ata_{self._take_hex(16)}",
+                mint=mint,
+                token_program=token_program,
+            )
+            slot.add_account(account)
+            accounts.append(account)
+        return accounts
+
     def close_associated_account(
         self, ata_address: str, force: bool = False
     ) -> tuple[AssociatedTokenAccount, int]:
         """Remove an ATA from the preview cache and return reclaimed rent."""
 
-        accounts = self.state.associated_accounts_for_network()
-        match = next((ata for ata in accounts if ata.address == ata_address), None)
+        match = self.state.associated_account(ata_address)
         if match is None:
             raise ValueError("Associated account not found for this network")
         if match.balance > 0 and not force:
             raise ValueError("Account still holds tokens; close requires confirmation")
 
-        remaining = [ata for ata in accounts if ata.address != ata_address]
-        self.state.replace_associated_accounts(remaining)
+        self.state.remove_associated_account(ata_address)
         return match, match.rent_lamports
 
     def active_token_account(self, mint: Optional[str] = None) -> Optional[AssociatedTokenAccount]:
@@ -840,13 +1531,21 @@ class WalletController:
         amount_sol: float,
         rate_limit_per_sec: Optional[float] = None,
         on_progress: Optional[Callable[[str], None]] = None,
+        context: Optional[tuple[str, int]] = None,
     ) -> TransferResult:
-        """Perform a single token transfer with lightweight progress hooks."""
+        """Perform a single token transfer with lightweight progress hooks.
+
+        ``context`` is a ``(blockhash, fee_lamports)`` pair from
+        :meth:`_prepare_batch_context`; when omitted it comes from
+        :meth:`prime_transaction_context`, which also refreshes the balance.
+        """
 
         if self._keypair is None:
             raise RuntimeError("No keypair is loaded")
         if amount_sol <= 0:
             raise ValueError("Amount must be greater than zero")
+        if not is_base58_pubkey(recipient):
+            raise ValueError(INVALID_RECIPIENT_MESSAGE)
 
         self.require_token_program_support(self.state.token_program)
 
@@ -860,17 +1559,17 @@ class WalletController:
             if on_progress:
                 on_progress(message)
 
-        emit("Fetching recent blockhash…")
-        blockhash = self.fetch_recent_blockhash()
+        if context is None:
+            emit("Fetching recent blockhash and fee…")
+            context = self.prime_transaction_context()
+        blockhash, fee_lamports = context
 
-        emit("Estimating fee…")
-        fee_lamports = self.estimate_fee()
-
-        if rate_limit_per_sec and rate_limit_per_sec > 0:
-            time.sleep(1 / rate_limit_per_sec)
+        bucket = self._bucket_for(rate_limit_per_sec)
+        if bucket is not None:
+            bucket.acquire_blocking()
 
         emit("Submitting transaction…")
-        signature = secrets.token_hex(32)
+        signature = self._take_hex(32)
 
         emit("Transfer finalized")
         return TransferResult(
@@ -888,37 +1587,95 @@ class WalletController:
         rate_limit_per_sec: Optional[float] = None,
         on_progress: Optional[Callable[[TransferRequest, str], None]] = None,
     ) -> list[TransferResult]:
-        """Execute multiple transfers sequentially with optional rate limiting."""
+        """Execute multiple transfers concurrently with optional rate limiting.
 
-        results: list[TransferResult] = []
-        for transfer in transfers:
-            try:
-                result = self.transfer(
-                    transfer.recipient_address,
-                    transfer.amount_sol,
-                    rate_limit_per_sec=rate_limit_per_sec,
-                    on_progress=(
-                        lambda msg, t=transfer: on_progress(t, msg)
-                        if on_progress
-                        else None
+        Synchronous wrapper around :meth:`batch_transfer_async`; call that
+        directly when an event loop is already running.
+        """
+
+        return asyncio.run(
+            self.batch_transfer_async(
+                transfers, rate_limit_per_sec=rate_limit_per_sec, on_progress=on_progress
+            )
+        )
+
+    async def batch_transfer_async(
+        self,
+        transfers: Iterable[TransferRequest],
+        rate_limit_per_sec: Optional[float] = None,
+        on_progress: Optional[Callable[[TransferRequest, str], None]] = None,
+        max_concurrency: int = MAX_TRANSFER_WORKERS,
+    ) -> list[TransferResult]:
+        """Fan transfers out concurrently and return results in submission order.
+
+        Each transfer runs on a batch-scoped pool of at most ``max_concurrency``
+        worker threads so the RPC round-trips overlap instead of queueing
+        behind one another. Progress callbacks may fire from those worker
+        threads.
+        """
+
+        pending = list(transfers)
+        if not pending:
+            return []
+        valid = [is_base58_pubkey(transfer.recipient_address) for transfer in pending]
+        dispatch_count = sum(valid)
+        if not dispatch_count:
+            return [self._failed_result(transfer, INVALID_RECIPIENT_MESSAGE) for transfer in pending]
+        # One blockhash/fee lookup serves the whole batch.
+        context = await asyncio.to_thread(self._prepare_batch_context)
+        workers = max(1, min(dispatch_count, max_concurrency))
+        semaphore = asyncio.Semaphore(workers)
+        bucket = self._bucket_for(rate_limit_per_sec)
+        loop = asyncio.get_running_loop()
+
+        async def run(transfer: TransferRequest, is_valid: bool) -> TransferResult:
+            if not is_valid:
+                # Fail locally without taking a concurrency slot or a rate token.
+                raise ValueError(INVALID_RECIPIENT_MESSAGE)
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                return await loop.run_in_executor(
+                    pool,
+                    functools.partial(
+                        self.transfer,
+                        transfer.recipient_address,
+                        transfer.amount_sol,
+                        # A partial binds the request without building a closure per transfer.
+                        on_progress=functools.partial(on_progress, transfer) if on_progress else None,
+                        context=context,
                     ),
                 )
-                # Keep the human-friendly label in the result payload.
-                result.request.recipient_label = transfer.recipient_label
-                results.append(result)
-            except Exception as exc:  # noqa: BLE001 - propagate failures to UI
-                results.append(
-                    TransferResult(
-                        request=transfer,
-                        success=False,
-                        signature=None,
-                        blockhash=None,
-                        fee_lamports=0,
-                        error=str(exc),
-                    )
-                )
+
+        # A batch-scoped pool keeps large batches from monopolising the loop's
+        # default executor, and its threads are released once the batch ends.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfer") as pool:
+            outcomes = await asyncio.gather(
+                *(run(transfer, is_valid) for transfer, is_valid in zip(pending, valid)),
+                return_exceptions=True,
+            )
+
+        results: list[TransferResult] = []
+        for transfer, outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):  # propagate failures to UI
+                results.append(self._failed_result(transfer, str(outcome)))
+                continue
+            # Report the caller's request so the human-friendly label is kept.
+            results.append(outcome._replace(request=transfer))
         return results
 
+    def _failed_result(self, request: TransferRequest, error: str) -> TransferResult:
+        """Build the result reported for a transfer that did not go through."""
+
+        return TransferResult(
+            request=request,
+            success=False,
+            signature=None,
+            blockhash=None,
+            fee_lamports=0,
+            error=error,
+        )
+
     def fetch_history(
         self,
         mint: Optional[str] = None,
@@ -932,14 +1689,16 @@ class WalletController:
         passed back via ``before`` for pagination.
         """
 
+        from solders.pubkey import Pubkey
+
         if self._keypair is None:
             raise RuntimeError("No keypair is loaded")
 
-        owner_address = str(self._keypair.pubkey())
+        owner_address = self._pubkey_str
         token_account = self.active_token_account(mint)
 
         endpoint = self.select_endpoint()
-        client = Client(endpoint.url)
+        client = self._client_for(endpoint)
         try:
             addresses = [owner_address]
             if token_account:
@@ -1114,43 +1873,268 @@ class WalletController:
                 normalized.append(str(key))
         return normalized
 
+    def _take_hex(self, nbytes: int) -> str:
+        """Return ``nbytes`` of random data as hex from a shared entropy pool.
+
+        Preview placeholders only need per-batch uniqueness, so a single
+        ``os.urandom`` read is sliced across many calls instead of one syscall each.
+        """
+
+        with self._entropy_lock:
+            if self._entropy_offset + nbytes > len(self._entropy_pool):
+                self._entropy_pool = os.urandom(max(ENTROPY_POOL_BYTES, nbytes))
+                self._entropy_offset = 0
+            pool, start = self._entropy_pool, self._entropy_offset
+            self._entropy_offset = start + nbytes
+        return pool[start : start + nbytes].hex()
+
+    def _bucket_for(self, rate_limit_per_sec: Optional[float]) -> Optional[TokenBucket]:
+        """Return the controller's rate limiter, rebuilding it when the rate changes."""
+
+        if not rate_limit_per_sec or rate_limit_per_sec <= 0:
+            return None
+        bucket = self._rate_bucket
+        if bucket is None or bucket.refill_rate != rate_limit_per_sec:
+            # Allow up to one second of accrued credit as a burst.
+            bucket = TokenBucket(rate_limit_per_sec, capacity=max(1.0, rate_limit_per_sec))
+            self._rate_bucket = bucket
+        return bucket
+
+    def _dedup(self, key: Hashable, fn: Callable[..., _T], *args: object) -> _T:
+        """Run ``fn(*args)`` once for all concurrent callers sharing ``key``.
+
+        The first caller performs the call; callers arriving while it is in
+        flight wait for and receive the same result (or exception).
+        """
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _io_executor(self) -> ThreadPoolExecutor:
+        """Return the controller's shared I/O thread pool, creating it on first use."""
+
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=len(NETWORKS), thread_name_prefix="wallet-io"
+            )
+        return self._io_pool
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        """Return the pool hedged RPC calls run on, creating it on first use."""
+
+        pool = self._hedge_pool
+        if pool is None:
+            # Failover runs on transfer and I/O worker threads, so guard creation.
+            with self._hedge_pool_lock:
+                pool = self._hedge_pool
+                if pool is None:
+                    pool = ThreadPoolExecutor(
+                        max_workers=4 * (1 + HEDGE_FANOUT), thread_name_prefix="rpc-hedge"
+                    )
+                    self._hedge_pool = pool
+        return pool
+
+    def close(self) -> None:
+        """Shut down worker pools and pooled connections; they are recreated on next use."""
+
+        with self._hedge_pool_lock:
+            hedge_pool, self._hedge_pool = self._hedge_pool, None
+        io_pool, self._io_pool = self._io_pool, None
+        for pool in (hedge_pool, io_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def _http_client(self) -> httpx.Client:
+        """Return the shared HTTP client used for raw JSON-RPC requests."""
+
+        client = self._http
+        if client is None:
+            with self._http_lock:
+                client = self._http
+                if client is None:
+                    import httpx
+
+                    limits = httpx.Limits(max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS)
+                    try:
+                        client = httpx.Client(http2=True, limits=limits)
+                    except ImportError:
+                        # HTTP/2 needs the optional ``h2`` package; keep-alive alone still
+                        # skips the per-call TCP/TLS handshake.
+                        client = httpx.Client(limits=limits)
+                    self._http = client
+        return client
+
+    def _rpc_request(
+        self, endpoint: EndpointStatus, method: str, params: Optional[list] = None
+    ) -> dict:
+        """POST a single JSON-RPC call over the shared HTTP client and return its result.
+
+        Raises ``RpcError`` when the node replies with a JSON-RPC error.
+        """
+
+        payload: dict[str, object] = {"jsonrpc": "2.0", "id": 0, "method": method}
+        if params is not None:
+            payload["params"] = params
+        response = self._http_client().post(endpoint.url, json=payload)
+        response.raise_for_status()
+        reply = response.json()
+        if "error" in reply:
+            error = reply["error"]
+            raise RpcError(method, error.get("code"), error.get("message", error))
+        return reply["result"]
+
+    def _client_for(self, endpoint: EndpointStatus) -> Client:
+        """Return the pooled RPC client for the endpoint, creating it on first use."""
+
+        client = self._clients.get(endpoint.url)
+        if client is None:
+            from solana.rpc.api import Client
+
+            # setdefault keeps a single client if two worker threads race here.
+            client = self._clients.setdefault(
+                endpoint.url, Client(endpoint.url, timeout=RPC_TIMEOUT_SECONDS)
+            )
+        return client
+
     def _apply_keypair(self, keypair: Keypair) -> None:
         if self.lock_manager:
             self.lock_manager.unlock_with_keypair(keypair)
             return
 
-        self._keypair = keypair
-        self.state.public_key = str(keypair.pubkey())
+        self._set_keypair(keypair)
         self.state.locked = False
         self.state.sol_balance = None
         self.state.decrypting = False
         self.state.unlock_error = None
 
-    def _receive_unlock(self, keypair: Keypair) -> None:
+    def _set_keypair(self, keypair: Keypair) -> None:
         self._keypair = keypair
-        self.state.public_key = str(keypair.pubkey())
+        self._pubkey_str = str(keypair.pubkey())
+        self.state.set_public_key(self._pubkey_str)
+
+    def _receive_unlock(self, keypair: Keypair) -> None:
+        self._set_keypair(keypair)
         self.state.locked = False
         self.state.sol_balance = None
 
     def _receive_lock(self) -> None:
         self._keypair = None
-        self.state.public_key = None
+        self._pubkey_str = None
+        self.state.set_public_key(None)
         self.state.locked = True
         self.state.sol_balance = None
 
     def select_endpoint(self, network: Optional[Network] = None) -> EndpointStatus:
-        """Pick the best endpoint based on health and priority."""
+        """Pick the best endpoint based on breaker state, health, latency and priority."""
 
-        network_endpoints = self.endpoints.get(network or self.state.network, [])
+        network_endpoints = self.state.endpoint_statuses_for_network(network)
         if not network_endpoints:
             raise RuntimeError("No endpoints configured for the requested network")
+        return min(network_endpoints, key=_endpoint_rank_key(time.time()))
+
+    def _ranked_endpoints(self, network: Optional[Network] = None) -> list[EndpointStatus]:
+        """Return the network's endpoints from most to least preferred."""
 
-        # Prefer healthy endpoints, then unknown, then unhealthy; lowest priority wins.
-        def sort_key(ep: EndpointStatus) -> tuple[int, int]:
-            health_rank = 0 if ep.healthy else (1 if ep.healthy is None else 2)
-            return (health_rank, ep.priority)
+        network_endpoints = self.state.endpoint_statuses_for_network(network)
+        if not network_endpoints:
+            raise RuntimeError("No endpoints configured for the requested network")
+        return sorted(network_endpoints, key=_endpoint_rank_key(time.time()))
+
+    def _with_endpoint_failover(
+        self, rpc_call: Callable[[EndpointStatus], _T], network: Optional[Network] = None
+    ) -> _T:
+        """Run ``rpc_call`` against the best endpoint, hedging onto backups when slow.
+
+        Endpoints with an open circuit breaker are not contacted. The primary
+        endpoint is tried first. If it hasn't answered within
+        ``HEDGE_AFTER_SECONDS`` (or fails sooner), up to ``HEDGE_FANOUT`` backups
+        are raced against it and the first success wins. Failed endpoints are
+        marked unhealthy; endpoints still outstanding at ``RPC_DEADLINE_SECONDS``
+        are treated as failed and ``TimeoutError`` is raised. Errors that no
+        other endpoint could fix (see ``_is_retryable``) are raised at once.
+        """
 
-        return sorted(network_endpoints, key=sort_key)[0]
+        now = time.time()
+        # Open breakers are skipped outright so a dead endpoint costs nothing
+        # until its recovery window lets a half-open trial through.
+        ranked = [
+            endpoint
+            for endpoint in self._ranked_endpoints(network)
+            if endpoint.breaker_state(now) != "open"
+        ]
+        if not ranked:
+            raise RuntimeError("Every endpoint is cooling down after repeated failures")
+        primary, backups = ranked[0], ranked[1 : 1 + HEDGE_FANOUT]
+        deadline = time.monotonic() + RPC_DEADLINE_SECONDS
+
+        def timed_call(endpoint: EndpointStatus) -> tuple[_T, float]:
+            start = time.perf_counter()
+            value = rpc_call(endpoint)
+            return value, (time.perf_counter() - start) * 1000
+
+        hedge_pool = self._hedge_executor()
+        in_flight: dict[Future, EndpointStatus] = {
+            hedge_pool.submit(timed_call, primary): primary
+        }
+        hedged = not backups
+        timeout = HEDGE_AFTER_SECONDS
+        last_error: Optional[BaseException] = None
+        while in_flight:
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                endpoint = in_flight.pop(future)
+                try:
+                    value, latency_ms = future.result()
+                except Exception as exc:  # noqa: BLE001 - try the next endpoint
+                    if not _is_retryable(exc):
+                        # The node answered; every other endpoint would reject it too.
+                        for loser in in_flight:
+                            loser.cancel()
+                        raise
+                    last_error = exc
+                    self.mark_endpoint_failed(endpoint)
+                    continue
+                endpoint.mark_result(True, latency_ms)
+                for loser in in_flight:
+                    loser.cancel()
+                return value
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for future, endpoint in in_flight.items():
+                    future.cancel()
+                    self.mark_endpoint_failed(endpoint)
+                raise TimeoutError("RPC request timed out on every endpoint")
+            if not hedged:
+                # Primary is slow or already failed: race the backups against it.
+                hedged = True
+                for endpoint in backups:
+                    in_flight[hedge_pool.submit(timed_call, endpoint)] = endpoint
+            timeout = remaining
+
+        raise last_error if last_error is not None else RuntimeError("No endpoint answered")
 
     def mark_endpoint_failed(self, endpoint: EndpointStatus) -> None:
         """Mark an endpoint as unhealthy after an error."""
@@ -1160,4 +2144,4 @@ class WalletController:
     def _mark_endpoint_healthy(self, endpoint: EndpointStatus) -> None:
         """Refresh basic metadata for a successful request."""
 
-        endpoint.mark_result(True, endpoint.latency_ms)
+        endpoint.mark_result(True, None)
@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+
+def make_qapp():
+    """Return the process-wide QApplication, creating an offscreen one if needed."""
+
+    pytest.importorskip("PySide6.QtWidgets")
+    from PySide6.QtWidgets import QApplication
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication([])
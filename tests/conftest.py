@@ -0,0 +1,47 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from _qt_support import make_qapp
+
+# Make the in-tree package importable without installing it.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+_QT_AVAILABLE = importlib.util.find_spec("PySide6") is not None
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "requires_qt: test needs PySide6 and a QApplication")
+    # Split runs: ``pytest -n auto -m parallel_safe`` then ``pytest -m "not parallel_safe"``.
+    config.addinivalue_line("markers", "parallel_safe: no Qt or shared state; fine under xdist")
+    config.addinivalue_line("markers", "serial: uses the shared QApplication; keep in one process")
+
+
+def pytest_collection_modifyitems(config, items):
+    if _QT_AVAILABLE:
+        return
+    skip_qt = pytest.mark.skip(reason="PySide6 is not installed")
+    for item in items:
+        if "requires_qt" in item.keywords:
+            item.add_marker(skip_qt)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return make_qapp()
+
+
+@pytest.fixture(scope="session")
+def _console_singleton(qapp):
+    from aloran_treasury.app import TreasuryConsole
+
+    return TreasuryConsole()
+
+
+@pytest.fixture
+def console(_console_singleton):
+    _console_singleton.wallet_controller.reset()
+    _console_singleton._update_lock_ui()
+    return _console_singleton
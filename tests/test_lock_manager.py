@@ -1,11 +1,8 @@
-import sys
 import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
 from aloran_treasury.lock_manager import LockManager
 from solders.keypair import Keypair
 
@@ -1,45 +1,38 @@
-import os
-
 import pytest
 
-pytest.importorskip("PySide6")
+# Keeps collection from failing on the Qt imports below when PySide6 is absent.
 pytest.importorskip("PySide6.QtWidgets")
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QSignalBlocker
 from solders.pubkey import Pubkey
 
 from aloran_treasury.components.mint import MintSettingsPanel, validate_pubkey
 from aloran_treasury.wallet import MintInfo, WalletController, WalletState
 
+pytestmark = [pytest.mark.requires_qt, pytest.mark.serial]
+
 
-@pytest.fixture(scope="module")
-def qapp():
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
+_SAMPLE_PUBKEY = str(Pubkey.default())
 
 
-def _sample_pubkey() -> str:
-    return str(Pubkey.default())
+# The panel only reads mint info, so one instance serves every test.
+_MINT_INFO = MintInfo(
+    mint_address=_SAMPLE_PUBKEY,
+    token_program="Token-2022",
+    transfer_hook_program=_SAMPLE_PUBKEY,
+    transfer_hook_accounts=[_SAMPLE_PUBKEY],
+    close_authority=_SAMPLE_PUBKEY,
+    interest_rate=1.25,
+    interest_authority=_SAMPLE_PUBKEY,
+)
 
 
 def test_prefill_from_mint_info(qapp):
     state = WalletState()
     controller = WalletController(state)
     panel = MintSettingsPanel(controller, state)
-    info = MintInfo(
-        mint_address=_sample_pubkey(),
-        token_program="Token-2022",
-        transfer_hook_program=_sample_pubkey(),
-        transfer_hook_accounts=[_sample_pubkey()],
-        close_authority=_sample_pubkey(),
-        interest_rate=1.25,
-        interest_authority=_sample_pubkey(),
-    )
-
-    panel._apply_mint_info(info)
+
+    panel._apply_mint_info(_MINT_INFO)
 
     assert panel.transfer_hook_checkbox.isChecked()
     assert panel.close_checkbox.isChecked()
@@ -54,18 +47,27 @@ def test_collect_form_state_builds_payload(qapp):
     captured = []
     panel = MintSettingsPanel(controller, state, on_payload_ready=captured.append)
 
-    panel.mint_input.setText(_sample_pubkey())
+    # Fill the form with the extension toggles muted, then sync field states once.
+    checkboxes = (panel.transfer_hook_checkbox, panel.close_checkbox, panel.interest_checkbox)
+    blockers = [QSignalBlocker(checkbox) for checkbox in checkboxes]
+    panel.mint_input.setText(_SAMPLE_PUBKEY)
     panel.transfer_hook_checkbox.setChecked(True)
-    panel.transfer_program_input.setText(_sample_pubkey())
-    panel.transfer_accounts_input.setText(_sample_pubkey())
+    panel.transfer_program_input.setText(_SAMPLE_PUBKEY)
+    panel.transfer_accounts_input.setText(_SAMPLE_PUBKEY)
     panel.close_checkbox.setChecked(True)
-    panel.close_input.setText(_sample_pubkey())
+    panel.close_input.setText(_SAMPLE_PUBKEY)
     panel.interest_checkbox.setChecked(True)
     panel.interest_rate_input.setValue(2.5)
-    panel.interest_authority_input.setText(_sample_pubkey())
+    panel.interest_authority_input.setText(_SAMPLE_PUBKEY)
+    for blocker in blockers:
+        blocker.unblock()
+    panel._toggle_transfer_hook_fields()
+    panel._toggle_close_fields()
+    panel._toggle_interest_fields()
 
     state = panel._collect_form_state()
     payload = controller.build_mint_payload(state)
+    assert controller.build_mint_payload(state) is payload
 
     assert payload["token_program"] == "Token-2022"
     assert "transfer_hook" in payload and "accounts" in payload["transfer_hook"]
@@ -73,6 +75,10 @@ def test_collect_form_state_builds_payload(qapp):
     assert payload["interest_bearing"]["rate"] == 2.5
 
 
-def test_validate_pubkey_handles_invalid_strings():
-    assert validate_pubkey(_sample_pubkey())
-    assert not validate_pubkey("not-a-key")
+def test_validate_pubkey_accepts_valid_key():
+    assert validate_pubkey(_SAMPLE_PUBKEY)
+
+
+@pytest.mark.parametrize("bad", ["", "not-a-key", "0" * 85, "@@@", "1" * 44, "x" * 200])
+def test_validate_pubkey_rejects_invalid_strings(bad):
+    assert not validate_pubkey(bad)
@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from aloran_treasury.network_monitor import MAX_SLOT_DRIFT, NetworkMonitor, reject_out_of_sync
+from aloran_treasury.wallet import Network, WalletState
+
+pytestmark = [pytest.mark.requires_qt, pytest.mark.serial]
+
+
+def test_reject_out_of_sync_flags_lagging_endpoint():
+    results = [
+        ("https://a.example", True, 40.0, 1.0),
+        ("https://b.example", True, 55.0, 1.0),
+        ("https://c.example", True, 10.0, 1.0),
+        ("https://d.example", False, None, 1.0),
+    ]
+    slots = {
+        "https://a.example": 1_000,
+        "https://b.example": 1_000 + MAX_SLOT_DRIFT,
+        "https://c.example": 1_000 - 3_500_000,
+    }
+
+    filtered = reject_out_of_sync(results, slots)
+
+    assert [healthy for _, healthy, _, _ in filtered] == [True, True, False, False]
+    assert filtered[2][2] == 10.0
+
+
+def test_reject_out_of_sync_trusts_the_higher_of_two_readings():
+    results = [("https://a.example", True, 40.0, 1.0), ("https://b.example", True, 55.0, 1.0)]
+
+    filtered = reject_out_of_sync(results, {"https://a.example": 1, "https://b.example": 900})
+
+    assert [healthy for _, healthy, _, _ in filtered] == [False, True]
+
+
+def test_reject_out_of_sync_ignores_a_single_reading():
+    results = [("https://a.example", True, 40.0, 1.0)]
+
+    assert reject_out_of_sync(results, {"https://a.example": 1}) == results
+
+
+def test_stop_discards_probe_rounds_still_in_flight(qapp, monkeypatch):
+    state = WalletState(network=Network.DEVNET)
+    monitor = NetworkMonitor(state)
+    started, release = threading.Event(), threading.Event()
+
+    def ping(url):
+        started.set()
+        release.wait(5)
+        return False, None, None
+
+    monkeypatch.setattr(monitor, "_ping_endpoint", ping)
+    monitor.force_poll()
+    assert started.wait(5)
+    in_flight = monitor._in_flight
+
+    monitor.stop()
+    release.set()
+    in_flight.result(timeout=5)
+    qapp.processEvents()
+    monitor.force_poll()
+
+    assert state.slot().active_endpoint.healthy is None
+    assert monitor._in_flight is in_flight
@@ -1,29 +1,16 @@
-import os
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
-from aloran_treasury.wallet import WalletController, WalletState
-
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from aloran_treasury.wallet import Network, WalletController, WalletState
 
 
-def _console():
-    pytest.importorskip("PySide6")
-    try:
-        from PySide6.QtWidgets import QApplication
-    except ImportError as exc:  # pragma: no cover - environment specific
-        pytest.skip(f"PySide6 unavailable: {exc}")
+@pytest.fixture
+def token_console(console):
+    """Shared console that is put back on Devnet/Token-2022 after the test."""
 
-    from aloran_treasury.app import TreasuryConsole
-
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return TreasuryConsole()
+    yield console
+    if console.wallet_state.network is not Network.DEVNET:
+        console._handle_network_changed(Network.DEVNET.label)
+    console.program_select.setCurrentText("Token-2022")
 
 
 def test_supported_cluster_allows_token2022():
@@ -46,11 +33,14 @@ def test_incompatible_cluster_blocks_token2022(monkeypatch):
         controller.require_token_program_support(state.token_program)
 
 
-def test_ui_updates_and_blocks_submission(monkeypatch):
-    console = _console()
-
+@pytest.mark.requires_qt
+@pytest.mark.serial
+def test_ui_updates_and_blocks_submission(token_console, monkeypatch):
+    console = token_console
     captured_errors: list[tuple[str, str]] = []
-    console._show_error = lambda title, msg: captured_errors.append((title, msg))
+    monkeypatch.setattr(
+        console, "_show_error", lambda title, msg: captured_errors.append((title, msg))
+    )
 
     console._handle_network_changed("Testnet")
     console._change_token_program("Token-2022")
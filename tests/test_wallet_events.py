@@ -0,0 +1,299 @@
+import threading
+import time
+
+import pytest
+
+from aloran_treasury.wallet import (
+    AssociatedTokenAccount,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RECOVERY_SECONDS,
+    EndpointStatus,
+    Network,
+    RpcError,
+    WalletController,
+    WalletState,
+)
+
+pytestmark = pytest.mark.parallel_safe
+
+
+def _use_endpoints(controller: WalletController, *labels: str) -> list[EndpointStatus]:
+    """Replace the active network's endpoints with ``labels``, in priority order."""
+
+    endpoints = [
+        EndpointStatus(url=f"https://{label.lower()}.example", label=label, priority=priority)
+        for priority, label in enumerate(labels)
+    ]
+    controller.state.slot().endpoints[:] = endpoints
+    return endpoints
+
+
+@pytest.fixture
+def controller():
+    controller = WalletController(WalletState(network=Network.DEVNET))
+    yield controller
+    controller.close()
+
+
+def test_endpoint_check_notifies_listeners_and_smooths_latency():
+    state = WalletState()
+    notifications: list[None] = []
+    state.subscribe_endpoint_updates(lambda: notifications.append(None))
+    url = state.current_endpoint_status().url
+
+    state.record_endpoint_check(url, True, 100.0, 1000.0)
+    state.record_endpoint_check(url, True, 200.0, 1001.0)
+
+    status = state.current_endpoint_status()
+    assert len(notifications) == 2
+    assert status.latency_ms == 200.0
+    assert status.ewma_latency_ms == 130.0
+    assert status.last_checked == 1001.0
+
+
+def test_breaker_opens_after_repeated_failures_and_recovers():
+    status = EndpointStatus(url="https://rpc.example", label="Example")
+
+    for attempt in range(BREAKER_FAILURE_THRESHOLD - 1):
+        status.mark_result(False, None, timestamp=100.0 + attempt)
+    assert status.breaker_state(now=110.0) == "closed"
+
+    status.mark_result(False, None, timestamp=110.0)
+    assert status.breaker_state(now=110.0) == "open"
+    assert status.breaker_state(now=110.0 + BREAKER_RECOVERY_SECONDS) == "half-open"
+
+    status.mark_result(True, 50.0, timestamp=110.0 + BREAKER_RECOVERY_SECONDS)
+    assert status.breaker_state() == "closed"
+    assert status.consecutive_failures == 0
+
+
+def test_select_endpoint_prefers_lower_latency_and_skips_open_breakers(controller):
+    state = controller.state
+    slot = state.slot()
+    slot.endpoints.append(EndpointStatus(url="https://fast.example", label="Fast", priority=5))
+    primary, fast = slot.endpoints[0], slot.endpoints[-1]
+
+    state.record_endpoint_check(primary.url, True, 400.0, 1000.0)
+    state.record_endpoint_check(fast.url, True, 40.0, 1000.0)
+    assert controller.select_endpoint() is fast
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        fast.mark_result(False, None)
+    assert controller.select_endpoint() is primary
+
+
+def test_advance_prefers_last_known_good_endpoint_over_round_robin():
+    state = WalletState(network=Network.DEVNET)
+    slot = state.slot()
+    slot.endpoints[:] = [
+        EndpointStatus(url=f"https://rpc{i}.example", label=f"RPC {i}", priority=i)
+        for i in range(3)
+    ]
+    state.record_endpoint_check("https://rpc2.example", True, 80.0, time.time())
+
+    assert state.advance_to_next_endpoint().url == "https://rpc2.example"
+    # The endpoint we rotated away from was demoted, so it is not picked straight back.
+    assert state.advance_to_next_endpoint().url == "https://rpc1.example"
+
+
+def test_associated_account_indexes_stay_in_sync():
+    state = WalletState()
+    accounts = [
+        AssociatedTokenAccount(address=f"ata{i}", mint="MintA" if i % 2 else "MintB", token_program="Token")
+        for i in range(4)
+    ]
+    state.replace_associated_accounts(accounts)
+
+    assert state.associated_accounts_for_network() == accounts
+    assert [ata.address for ata in state.associated_accounts_for_mint("MintA")] == ["ata1", "ata3"]
+
+    assert state.remove_associated_account("ata1") is accounts[1]
+    assert state.associated_account("ata1") is None
+    assert [ata.address for ata in state.associated_accounts_for_mint("MintA")] == ["ata3"]
+    assert state.remove_associated_account("ata3") is accounts[3]
+    assert state.associated_accounts_for_mint("MintA") == []
+
+
+def test_status_line_uses_cached_short_key_and_clears_on_lock(controller):
+    controller.generate_ephemeral()
+    state = controller.state
+    state.locked = False
+    key = state.public_key
+
+    assert state.status_line() == f"Active on Devnet · {key[:4]}…{key[-4:]}"
+    state.sol_balance = 1.25
+    assert state.status_line().endswith(" · 1.2500 SOL")
+
+    controller._receive_lock()
+    assert state.short_public_key is None
+    assert state.status_line() == "Locked · No key loaded"
+
+
+def test_generated_secret_round_trips_through_import(controller):
+    secret = controller.generate_ephemeral()
+    public_key = controller.state.public_key
+
+    assert controller.export_secret() == secret
+    assert controller.import_secret(secret) == public_key
+
+
+def test_reset_discards_key_and_relocks(controller):
+    controller.generate_ephemeral()
+    controller.state.unlock_error = "Incorrect passphrase"
+
+    controller.reset()
+
+    assert controller.state.locked
+    assert controller.state.public_key is None
+    assert controller.state.unlock_error is None
+    with pytest.raises(RuntimeError, match="No keypair"):
+        controller.export_secret()
+
+
+def test_bulk_ensure_reuses_existing_accounts_in_input_order(controller):
+    controller.generate_ephemeral()
+    existing = controller.ensure_associated_account("MintB")
+
+    accounts = controller.bulk_ensure(["MintA", "MintB", "MintA", "MintC"])
+
+    assert [ata.mint for ata in accounts] == ["MintA", "MintB", "MintA", "MintC"]
+    assert accounts[1] is existing
+    assert accounts[0] is accounts[2]
+    assert len(controller.list_associated_accounts()) == 3
+    assert controller.state.active_mint == "MintB"
+
+
+def test_record_endpoint_checks_notifies_once_per_round():
+    state = WalletState(network=Network.MAINNET)
+    notifications: list[None] = []
+    state.subscribe_endpoint_updates(lambda: notifications.append(None))
+    urls = [status.url for status in state.endpoint_statuses_for_network()]
+
+    slot = state.record_endpoint_checks([(url, False, None, 1000.0) for url in urls])
+
+    assert slot is state.slot(Network.MAINNET)
+    assert all(status.healthy is False for status in slot.endpoints)
+    assert len(notifications) == 1
+
+
+def test_failover_hedges_slow_primary_onto_backup(controller):
+    slow, quick = _use_endpoints(controller, "Slow", "Quick")
+    # The primary stays blocked until the test ends, so only a hedge can answer.
+    release_primary = threading.Event()
+
+    def rpc_call(endpoint: EndpointStatus) -> str:
+        if endpoint.label == "Slow":
+            release_primary.wait(timeout=5)
+        return endpoint.label
+
+    try:
+        assert controller._with_endpoint_failover(rpc_call) == "Quick"
+    finally:
+        release_primary.set()
+    assert quick.healthy is True
+    assert quick.ewma_latency_ms is not None
+    assert slow.ewma_latency_ms is None
+
+
+def test_failover_moves_past_failing_primary(controller):
+    down, up = _use_endpoints(controller, "Down", "Up")
+
+    def rpc_call(endpoint: EndpointStatus) -> str:
+        if endpoint.label == "Down":
+            raise ConnectionError("refused")
+        return endpoint.label
+
+    assert controller._with_endpoint_failover(rpc_call) == "Up"
+    assert down.healthy is False
+    assert down.consecutive_failures == 1
+
+
+def test_advance_picks_lowest_latency_healthy_endpoint():
+    state = WalletState(network=Network.DEVNET)
+    slot = state.slot()
+    slot.endpoints[:] = [
+        EndpointStatus(url=f"https://rpc{i}.example", label=f"RPC {i}", priority=i)
+        for i in range(4)
+    ]
+    now = time.time()
+    state.record_endpoint_checks(
+        [
+            ("https://rpc1.example", True, 300.0, now),
+            ("https://rpc2.example", False, None, now),
+            ("https://rpc3.example", True, 40.0, now),
+        ]
+    )
+
+    assert state.advance_to_next_endpoint().url == "https://rpc3.example"
+
+
+def test_advance_skips_open_breakers():
+    state = WalletState(network=Network.DEVNET)
+    slot = state.slot()
+    slot.endpoints[:] = [
+        EndpointStatus(url=f"https://rpc{i}.example", label=f"RPC {i}", priority=i)
+        for i in range(3)
+    ]
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        slot.endpoints[1].mark_result(False, None)
+
+    assert state.advance_to_next_endpoint().url == "https://rpc2.example"
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        slot.endpoints[0].mark_result(False, None)
+
+    # With every alternative tripped, stay on the current endpoint.
+    assert state.advance_to_next_endpoint().url == "https://rpc2.example"
+
+
+def test_failover_skips_open_breakers(controller):
+    dead, live = _use_endpoints(controller, "Dead", "Live")
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        dead.mark_result(False, None)
+    contacted: list[str] = []
+
+    def rpc_call(endpoint: EndpointStatus) -> str:
+        contacted.append(endpoint.label)
+        return endpoint.label
+
+    assert controller._with_endpoint_failover(rpc_call) == "Live"
+    assert contacted == ["Live"]
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        live.mark_result(False, None)
+    with pytest.raises(RuntimeError, match="cooling down"):
+        controller._with_endpoint_failover(rpc_call)
+
+
+def test_network_slots_are_built_on_first_use():
+    state = WalletState(network=Network.DEVNET)
+
+    assert state.slots == [None, None, None]
+    assert state.current_endpoint_status().url == "https://api.devnet.solana.com"
+    assert state.slots[Network.MAINNET] is None
+    assert state.slot(Network.DEVNET) is state.slots[Network.DEVNET]
+
+
+def test_failover_raises_application_errors_without_rotating(controller):
+    primary, backup = _use_endpoints(controller, "Primary", "Backup")
+    contacted: list[str] = []
+
+    def rpc_call(endpoint: EndpointStatus) -> str:
+        contacted.append(endpoint.label)
+        raise RpcError("getBalance", -32602, "Invalid param: WrongSize")
+
+    with pytest.raises(RpcError, match="Invalid param"):
+        controller._with_endpoint_failover(rpc_call)
+    assert contacted == ["Primary"]
+    assert primary.consecutive_failures == 0
+
+
+def test_hedge_pool_is_created_lazily_and_released_on_close(controller):
+    _use_endpoints(controller, "Only")
+    assert controller._hedge_pool is None
+
+    assert controller._with_endpoint_failover(lambda endpoint: endpoint.label) == "Only"
+    assert controller._hedge_pool is not None
+
+    controller.close()
+    assert controller._hedge_pool is None
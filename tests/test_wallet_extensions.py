@@ -1,8 +1,6 @@
-import sys
-import unittest
-from pathlib import Path
+from dataclasses import FrozenInstanceError
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+import pytest
 
 from aloran_treasury.wallet import (
     InterestBearingConfig,
@@ -15,48 +13,47 @@ from aloran_treasury.wallet import (
     set_transfer_hook,
 )
 
+pytestmark = pytest.mark.parallel_safe
 
-class MintCreationTests(unittest.TestCase):
-    def test_create_mint_with_transfer_hook(self) -> None:
-        config = TransferHookConfig(
-            hook_program="Hook111", validation_accounts=["Val1", "Val2"]
-        )
-        instructions = create_mint_instructions(
-            token_program="Token-2022",
-            mint_address="Mint111",
-            decimals=6,
-            mint_authority="Auth111",
-            transfer_hook=config,
-        )
-
-        self.assertEqual(len(instructions), 3)
-        self.assertEqual(instructions[0].name, "initialize_mint")
-        self.assertEqual(instructions[1].name, "initialize_transfer_hook_extension")
-        self.assertEqual(instructions[2].data["validation_accounts"], ["Val1", "Val2"])
-        self.assertIn("Auth111", instructions[1].signers)
-
-    def test_create_mint_with_multiple_extensions(self) -> None:
-        transfer_config = TransferHookConfig(hook_program="Hook222")
-        interest_config = InterestBearingConfig(
-            rate_basis_points=250,
-            authority="RateAuth",
-            initialization_data={"period_days": 30},
-        )
-
-        instructions = create_mint_instructions(
-            token_program="Token-2022",
-            mint_address="Mint222",
-            decimals=2,
-            mint_authority="Auth222",
-            transfer_hook=transfer_config,
-            mint_close_authority="CloseAuth",
-            interest_bearing=interest_config,
-        )
-
-        names = [step.name for step in instructions]
-        self.assertEqual(
-            names,
-            [
+_HOOK_WITH_ACCOUNTS = TransferHookConfig(
+    hook_program="Hook111", validation_accounts=["Val1", "Val2"]
+)
+_HOOK = TransferHookConfig(hook_program="Hook222")
+_INTEREST = InterestBearingConfig(
+    rate_basis_points=250,
+    authority="RateAuth",
+    initialization_data={"period_days": 30},
+)
+
+
+def _create_mint(token_program: str = "Token-2022", **extensions) -> list[InstructionStep]:
+    return create_mint_instructions(
+        token_program=token_program,
+        mint_address="Mint111",
+        decimals=6,
+        mint_authority="Auth111",
+        **extensions,
+    )
+
+
+@pytest.mark.parametrize(
+    "extensions,expected_names",
+    [
+        (
+            {"transfer_hook": _HOOK_WITH_ACCOUNTS},
+            (
+                "initialize_mint",
+                "initialize_transfer_hook_extension",
+                "configure_transfer_hook",
+            ),
+        ),
+        (
+            {
+                "transfer_hook": _HOOK,
+                "mint_close_authority": "CloseAuth",
+                "interest_bearing": _INTEREST,
+            },
+            (
                 "initialize_mint",
                 "initialize_transfer_hook_extension",
                 "configure_transfer_hook",
@@ -64,60 +61,100 @@ class MintCreationTests(unittest.TestCase):
                 "set_mint_close_authority",
                 "initialize_interest_bearing_extension",
                 "set_interest_rate",
-            ],
-        )
-        self.assertEqual(instructions[-1].data["rate_basis_points"], 250)
-        self.assertEqual(instructions[-2].data, {"period_days": 30})
-
-    def test_legacy_program_rejects_extensions(self) -> None:
-        with self.assertRaises(TokenProgramUnsupportedError):
-            create_mint_instructions(
-                token_program="Token",
-                mint_address="MintLegacy",
-                decimals=0,
-                mint_authority="LegacyAuth",
-                transfer_hook=TransferHookConfig(hook_program="HookLegacy"),
-            )
-
-
-class MintUpdateTests(unittest.TestCase):
-    def test_update_helpers_require_token_2022(self) -> None:
-        with self.assertRaises(TokenProgramUnsupportedError):
-            set_transfer_hook(
-                token_program="Token",
-                mint_address="MintLegacy",
-                authority="LegacyAuth",
-                hook_program="HookLegacy",
-            )
-
-    def test_update_helpers_include_signers_and_data(self) -> None:
-        hook_instruction = set_transfer_hook(
-            token_program="Token-2022",
-            mint_address="Mint333",
-            authority="HookAuth",
-            hook_program="Hook333",
-            validation_accounts=["ValA"],
-        )
-        close_instruction = set_mint_close_authority(
-            token_program="Token-2022",
-            mint_address="Mint333",
-            authority="CloseAuth",
+            ),
+        ),
+    ],
+)
+def test_create_mint_instructions(extensions, expected_names):
+    assert tuple(step.name for step in _create_mint(**extensions)) == expected_names
+
+
+def test_create_mint_carries_extension_data():
+    hook_steps = _create_mint(transfer_hook=_HOOK_WITH_ACCOUNTS)
+    interest_steps = _create_mint(interest_bearing=_INTEREST)
+
+    assert hook_steps[2].data["validation_accounts"] == ["Val1", "Val2"]
+    assert "Auth111" in hook_steps[1].signers
+    assert interest_steps[-1].data["rate_basis_points"] == 250
+    assert interest_steps[-2].data == {"period_days": 30}
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: _create_mint("Token", transfer_hook=TransferHookConfig(hook_program="HookLegacy")),
+        lambda: set_transfer_hook(
+            token_program="Token",
+            mint_address="MintLegacy",
+            authority="LegacyAuth",
+            hook_program="HookLegacy",
+        ),
+        lambda: set_mint_close_authority(
+            token_program="Token",
+            mint_address="MintLegacy",
+            authority="LegacyAuth",
             close_authority="NewClose",
-        )
-        interest_instruction = set_interest_rate(
-            token_program="Token-2022",
-            mint_address="Mint333",
-            authority="RateAuth",
+        ),
+        lambda: set_interest_rate(
+            token_program="Token",
+            mint_address="MintLegacy",
+            authority="LegacyAuth",
             rate_basis_points=500,
-            initialization_data={"caps": "none"},
-        )
+        ),
+    ],
+    ids=["create_mint", "set_transfer_hook", "set_mint_close_authority", "set_interest_rate"],
+)
+def test_legacy_program_rejects_extensions(build):
+    with pytest.raises(TokenProgramUnsupportedError, match="does not support token-2022"):
+        build()
+
+
+def test_update_helpers_include_signers_and_data():
+    hook_instruction = set_transfer_hook(
+        token_program="Token-2022",
+        mint_address="Mint333",
+        authority="HookAuth",
+        hook_program="Hook333",
+        validation_accounts=["ValA"],
+    )
+    close_instruction = set_mint_close_authority(
+        token_program="Token-2022",
+        mint_address="Mint333",
+        authority="CloseAuth",
+        close_authority="NewClose",
+    )
+    interest_instruction = set_interest_rate(
+        token_program="Token-2022",
+        mint_address="Mint333",
+        authority="RateAuth",
+        rate_basis_points=500,
+        initialization_data={"caps": "none"},
+    )
+
+    assert isinstance(hook_instruction, InstructionStep)
+    assert hook_instruction.signers == ["HookAuth"]
+    assert close_instruction.data["close_authority"] == "NewClose"
+    assert interest_instruction.data["rate_basis_points"] == 500
+    assert interest_instruction.data["initialization_data"] == {"caps": "none"}
+
+
+def test_extension_configs_are_immutable():
+    with pytest.raises(FrozenInstanceError):
+        _HOOK.hook_program = "HookOther"
+    with pytest.raises(FrozenInstanceError):
+        _INTEREST.rate_basis_points = 1
 
-        self.assertIsInstance(hook_instruction, InstructionStep)
-        self.assertEqual(hook_instruction.signers, ["HookAuth"])
-        self.assertEqual(close_instruction.data["close_authority"], "NewClose")
-        self.assertEqual(interest_instruction.data["rate_basis_points"], 500)
-        self.assertEqual(interest_instruction.data["initialization_data"], {"caps": "none"})
 
+def test_extension_configs_are_hashable_and_detached_from_inputs():
+    accounts = ["Val1", "Val2"]
+    data = {"period_days": 30}
+    hook = TransferHookConfig(hook_program="Hook111", validation_accounts=accounts)
+    interest = InterestBearingConfig(
+        rate_basis_points=250, authority="RateAuth", initialization_data=data
+    )
+    accounts.append("Val3")
+    data["period_days"] = 1
 
-if __name__ == "__main__":
-    unittest.main()
+    assert hash(hook) == hash(_HOOK_WITH_ACCOUNTS)
+    assert hash(interest) == hash(_INTEREST)
+    assert len({hook, _HOOK_WITH_ACCOUNTS, interest, _INTEREST}) == 2
@@ -1,67 +1,87 @@
-import os
+import time
+
 import pytest
 
-pytest.importorskip("PySide6")
-pytest.importorskip("PySide6.QtWidgets")
+# Keeps collection from failing on the Qt import below when PySide6 is absent.
 pytest.importorskip("PySide6.QtTest")
 
 from PySide6.QtTest import QTest
-from PySide6.QtWidgets import QApplication
 
-from aloran_treasury.app import TreasuryConsole
 from aloran_treasury.wallet import TransferRequest
 
+pytestmark = [pytest.mark.requires_qt, pytest.mark.serial]
+
+_SAMPLE_REQUEST = TransferRequest(
+    recipient_label="Demo",
+    recipient_address="Recipient111",
+    amount_sol=1.0,
+)
+
 
-@pytest.fixture(scope="module")
-def qapp():
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
+def _wait_until(predicate, timeout_ms: int = 1000) -> None:
+    """Process Qt events until ``predicate`` holds instead of sleeping a fixed time."""
 
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met before timeout"
+        QTest.qWait(10)
 
-def test_locked_view_masks_sensitive_fields(qapp):
-    console = TreasuryConsole()
 
+def _fast_unlock(console) -> None:
+    """Unlock through the controller, skipping the deferred passphrase flow."""
+
+    controller = console.wallet_controller
+    controller.unlock_wallet(controller.demo_passphrase)
+    console._update_lock_ui()
+
+
+def test_locked_view_masks_sensitive_fields(console):
     assert console.wallet_state.locked
     assert console.lock_banner.isVisible()
     assert "hidden" in console.public_key_label.text().lower()
     assert console.unlock_button.isVisible()
-    assert all(not button.isEnabled() for button in console.action_buttons)
+    assert not any(console._action_enabled)
 
 
-def test_unlock_flow_updates_view(qapp):
-    console = TreasuryConsole()
+def test_unlock_flow_updates_view(console):
     console.wallet_controller.generate_ephemeral()
     console.wallet_controller.lock_wallet()
     console._update_lock_ui()
 
     console.passphrase_input.setText(console.wallet_controller.demo_passphrase)
     console._unlock_with_passphrase()
-    QTest.qWait(400)
+    _wait_until(lambda: not console.wallet_state.decrypting)
 
     assert not console.wallet_state.locked
     assert not console.lock_banner.isVisible()
     assert console.public_key_label.text().startswith("Public key: ")
-    assert any(button.isEnabled() for button in console.action_buttons)
+    assert any(console._action_enabled)
 
 
-def test_transfers_blocked_while_locked(qapp):
-    console = TreasuryConsole()
+def test_transfers_blocked_while_locked(console, monkeypatch):
     console.wallet_controller.generate_ephemeral()
     console.wallet_controller.lock_wallet()
     console._update_lock_ui()
 
     errors: list[tuple[str, str]] = []
-    console._show_error = lambda title, message: errors.append((title, message))
-
-    request = TransferRequest(
-        recipient_label="Demo",
-        recipient_address="Recipient111",
-        amount_sol=1.0,
+    monkeypatch.setattr(
+        console, "_show_error", lambda title, message: errors.append((title, message))
     )
-    console._process_transfers([request], rate_limit=None)
+
+    console._process_transfers([_SAMPLE_REQUEST], rate_limit=None)
 
     assert errors
     assert errors[0][0] == "Wallet locked"
+
+
+def test_relocking_masks_view_again(console):
+    console.wallet_controller.generate_ephemeral()
+    console.wallet_controller.lock_wallet()
+    _fast_unlock(console)
+    assert any(console._action_enabled)
+
+    console.wallet_controller.lock_wallet()
+    console._update_lock_ui()
+
+    assert console.lock_banner.isVisible()
+    assert not any(console._action_enabled)
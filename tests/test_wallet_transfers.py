@@ -0,0 +1,248 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aloran_treasury import wallet
+from aloran_treasury.wallet import (
+    INVALID_RECIPIENT_MESSAGE,
+    Network,
+    TokenBucket,
+    TransferRequest,
+    WalletController,
+    WalletState,
+)
+
+pytestmark = pytest.mark.parallel_safe
+
+
+def _recipient(n: int) -> str:
+    """Return a distinct, well-formed base58 address for test transfers."""
+
+    return f"Recipient{n}".ljust(32, "1")
+
+
+def _offline_controller(monkeypatch, rpc_calls: list[str] | None = None) -> WalletController:
+    controller = WalletController(WalletState())
+    controller.generate_ephemeral()
+    calls = rpc_calls if rpc_calls is not None else []
+
+    def fake_fetch(include_fee: bool = True) -> tuple[str, int | None]:
+        calls.append("blockhash+fee" if include_fee else "blockhash")
+        return "Blockhash111", 5000 if include_fee else None
+
+    monkeypatch.setattr(controller, "_fetch_blockhash_and_fee", fake_fetch)
+    return controller
+
+
+def test_batch_transfer_preserves_order_and_labels(monkeypatch):
+    controller = _offline_controller(monkeypatch)
+    transfers = [
+        TransferRequest("Alice", _recipient(1), 1.0),
+        TransferRequest("Bob", _recipient(2), 0.0),
+        TransferRequest("Carol", _recipient(3), 2.5),
+    ]
+
+    results = controller.batch_transfer(transfers)
+
+    assert [result.request.recipient_label for result in results] == ["Alice", "Bob", "Carol"]
+    assert [result.success for result in results] == [True, False, True]
+    assert results[1].error == "Amount must be greater than zero"
+    assert results[2].blockhash == "Blockhash111"
+
+
+def test_batch_transfer_fetches_context_once(monkeypatch):
+    calls: list[str] = []
+    controller = _offline_controller(monkeypatch, calls)
+    transfers = [TransferRequest(f"R{i}", _recipient(i + 1), 1.0) for i in range(5)]
+
+    results = controller.batch_transfer(transfers)
+
+    assert all(result.success for result in results)
+    assert {result.fee_lamports for result in results} == {5000}
+    assert calls == ["blockhash+fee"]
+
+
+def test_blockhash_and_fee_expire_independently(monkeypatch):
+    calls: list[str] = []
+    controller = _offline_controller(monkeypatch, calls)
+    clock = [1000.0]
+    monkeypatch.setattr(wallet.time, "monotonic", lambda: clock[0])
+
+    assert controller._prepare_batch_context() == ("Blockhash111", 5000)
+    clock[0] += wallet.BLOCKHASH_TTL_SECONDS - 1
+    assert controller.estimate_fee() == 5000
+    assert controller.fetch_recent_blockhash() == "Blockhash111"
+    clock[0] += 2
+    controller._prepare_batch_context()
+    clock[0] += wallet.FEE_TTL_SECONDS
+    controller._prepare_batch_context()
+
+    assert calls == ["blockhash+fee", "blockhash", "blockhash+fee"]
+
+
+def test_missing_fee_falls_back_to_default_and_is_cached(monkeypatch):
+    controller = WalletController(WalletState())
+    calls: list[bool] = []
+
+    def fetch_without_fee(include_fee: bool = True) -> tuple[str, None]:
+        calls.append(include_fee)
+        return "Blockhash111", None
+
+    monkeypatch.setattr(controller, "_fetch_blockhash_and_fee", fetch_without_fee)
+
+    expected = ("Blockhash111", wallet.DEFAULT_LAMPORTS_PER_SIGNATURE)
+    assert controller._prepare_batch_context() == expected
+    assert controller._prepare_batch_context() == expected
+    assert calls == [True]
+
+
+def test_batch_transfer_rejects_malformed_recipients_without_rpc(monkeypatch):
+    calls: list[str] = []
+    controller = _offline_controller(monkeypatch, calls)
+    transfers = [
+        TransferRequest("Typo", "0OIl-not-base58", 1.0),
+        TransferRequest("Short", "abc", 1.0),
+    ]
+
+    results = controller.batch_transfer(transfers)
+
+    assert [result.error for result in results] == [INVALID_RECIPIENT_MESSAGE] * 2
+    assert calls == []
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    now = [100.0]
+    bucket = TokenBucket(refill_rate=10.0, capacity=2.0, clock=lambda: now[0])
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.1
+    assert bucket.reserve() == 0.2
+
+    # Once the queued reservations have been paid off, a token is free again.
+    now[0] += 0.5
+    assert bucket.reserve() == 0.0
+
+
+def test_batch_transfer_reports_progress_per_request(monkeypatch):
+    controller = _offline_controller(monkeypatch)
+    transfers = [TransferRequest(f"R{i}", _recipient(i + 1), 1.0) for i in range(3)]
+    seen: list[tuple[str, str]] = []
+
+    controller.batch_transfer(
+        transfers, on_progress=lambda request, msg: seen.append((request.recipient_label, msg))
+    )
+
+    assert sorted(label for label, msg in seen if msg == "Transfer finalized") == ["R0", "R1", "R2"]
+
+
+def test_refresh_balances_all_updates_only_active_network(monkeypatch):
+    controller = WalletController(WalletState(network=Network.TESTNET))
+    controller.generate_ephemeral()
+    balances = {Network.MAINNET: 1.5, Network.TESTNET: 2.0, Network.DEVNET: None}
+    monkeypatch.setattr(controller, "_fetch_balance", lambda network: balances[network])
+
+    result = controller.refresh_balances_all()
+
+    assert result == {Network.MAINNET: 1.5, Network.TESTNET: 2.0}
+    assert controller.state.sol_balance == 2.0
+
+
+def test_duplicate_requests_share_context_but_not_signatures(monkeypatch):
+    calls: list[str] = []
+    controller = _offline_controller(monkeypatch, calls)
+    top_up = TransferRequest("Top-up", _recipient(7), 0.5)
+
+    results = controller.batch_transfer([top_up, top_up, top_up])
+
+    assert calls == ["blockhash+fee"]
+    assert {result.blockhash for result in results} == {"Blockhash111"}
+    assert len({result.signature for result in results}) == 3
+
+
+def test_concurrent_context_reads_share_one_request(monkeypatch):
+    controller = WalletController(WalletState())
+    calls: list[bool] = []
+
+    def slow_fetch(include_fee: bool = True) -> tuple[str, int]:
+        calls.append(include_fee)
+        time.sleep(0.2)
+        return "Blockhash111", 5000
+
+    monkeypatch.setattr(controller, "_fetch_blockhash_and_fee", slow_fetch)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        contexts = list(pool.map(lambda _: controller._prepare_batch_context(), range(4)))
+
+    assert contexts == [("Blockhash111", 5000)] * 4
+    assert calls == [True]
+
+
+def test_prime_transaction_context_fetches_everything_in_one_batch(monkeypatch):
+    controller = WalletController(WalletState())
+    controller.generate_ephemeral()
+    batches: list[list[str]] = []
+
+    def fake_batch(batch: list[dict]) -> dict[object, dict]:
+        batches.append([request["method"] for request in batch])
+        return {
+            0: {"id": 0, "result": {"value": {"blockhash": "Blockhash111"}}},
+            1: {"id": 1, "result": {"value": {"feeCalculator": {"lamportsPerSignature": 5000}}}},
+            2: {"id": 2, "result": {"value": 3_000_000_000}},
+        }
+
+    monkeypatch.setattr(controller, "_rpc_batch", fake_batch)
+
+    assert controller.prime_transaction_context() == ("Blockhash111", 5000)
+    assert controller.prime_transaction_context() == ("Blockhash111", 5000)
+    assert batches == [["getLatestBlockhash", "getFees", "getBalance"]]
+    assert controller.state.sol_balance == 3.0
+
+
+def test_estimate_fees_bulk_uses_one_fee_lookup(monkeypatch):
+    calls: list[str] = []
+    controller = _offline_controller(monkeypatch, calls)
+
+    assert controller.estimate_fees_bulk([0, 1, 3]) == [5000, 5000, 15000]
+    assert controller.estimate_fees_bulk(range(2)) == [5000, 5000]
+    assert calls == ["blockhash+fee"]
+
+
+def test_preflight_async_returns_context_and_balance(monkeypatch):
+    controller = WalletController(WalletState())
+    controller.generate_ephemeral()
+    batches: list[int] = []
+
+    def fake_batch(batch: list[dict]) -> dict[object, dict]:
+        batches.append(len(batch))
+        return {
+            0: {"id": 0, "result": {"value": {"blockhash": "Blockhash111"}}},
+            1: {"id": 1, "result": {"value": {"feeCalculator": {"lamportsPerSignature": 5000}}}},
+            2: {"id": 2, "result": {"value": 1_500_000_000}},
+        }
+
+    monkeypatch.setattr(controller, "_rpc_batch", fake_batch)
+
+    assert asyncio.run(controller.preflight_async()) == ("Blockhash111", 5000, 1.5)
+    assert batches == [3]
+
+
+def test_prime_caches_default_fee_when_node_lacks_get_fees(monkeypatch):
+    controller = WalletController(WalletState())
+    batches: list[list[str]] = []
+
+    def fake_batch(batch: list[dict]) -> dict[object, dict]:
+        batches.append([request["method"] for request in batch])
+        return {
+            0: {"id": 0, "result": {"value": {"blockhash": "Blockhash111"}}},
+            1: {"id": 1, "error": {"code": -32601, "message": "Method not found"}},
+        }
+
+    monkeypatch.setattr(controller, "_rpc_batch", fake_batch)
+
+    expected = ("Blockhash111", wallet.DEFAULT_LAMPORTS_PER_SIGNATURE)
+    assert controller.prime_transaction_context() == expected
+    assert controller.prime_transaction_context() == expected
+    assert controller.estimate_fee() == wallet.DEFAULT_LAMPORTS_PER_SIGNATURE
+    assert batches == [["getLatestBlockhash", "getFees"]]